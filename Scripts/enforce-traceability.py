@@ -27,6 +27,11 @@ from typing import Dict, List, Set, Tuple, Optional
 from datetime import datetime
 from dataclasses import dataclass, field
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 @dataclass
 class TraceabilityLink:
     """Represents a traceability link between lifecycle elements"""
@@ -228,7 +233,7 @@ class TraceabilityEnforcer:
             if yaml_end > 0:
                 try:
                     yaml_content = ''.join(lines[1:yaml_end])
-                    yaml_data = yaml.safe_load(yaml_content)
+                    yaml_data = yaml.load(yaml_content, Loader=SafeLoader)
                     
                     # Extract from traceability section
                     if 'traceability' in yaml_data:
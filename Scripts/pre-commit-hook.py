@@ -23,67 +23,168 @@ Usage with pre-commit framework:
           exclude: (README|template|TEMPLATE)
 """
 from __future__ import annotations
+import re
 import sys
+import os
+import json
+import time
+import hashlib
+import tempfile
 import subprocess
+import importlib.util
 from pathlib import Path
 
 # Import validation logic from existing script
 ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT / 'scripts'))
 
 try:
-    from validate_spec_structure import validate_spec, ValidationIssue, ROOT as VALIDATE_ROOT
-except ImportError:
+    _module = sys.modules.get('validate_spec_structure')
+    if _module is None:
+        _spec = importlib.util.spec_from_file_location(
+            'validate_spec_structure', ROOT / 'Scripts' / 'validate-spec-structure.py')
+        _module = importlib.util.module_from_spec(_spec)
+        _spec.loader.exec_module(_module)
+        sys.modules['validate_spec_structure'] = _module
+    validate_spec_bytes, ValidationIssue = _module.validate_spec_bytes, _module.ValidationIssue
+    SCHEMA_DIR = _module.SCHEMA_DIR
+except (ImportError, OSError, AttributeError):
     print("❌ Could not import validation module", file=sys.stderr)
     sys.exit(1)
 
+# Blob SHAs that already passed validation, so unchanged specs are not re-validated
+VALIDATED_CACHE = ROOT / '.git' / 'spec-cache' / 'validated.json'
+VALIDATED_CACHE_MAX_ENTRIES = 2000
 
-def get_staged_spec_files() -> list[Path]:
-    """Get list of staged markdown files that might be specs."""
+
+def validator_fingerprint() -> str:
+    """Hash of the validator and its schemas; a change invalidates cached results."""
+    digest = hashlib.sha1(Path(_module.__file__).read_bytes())
+    for schema in sorted(SCHEMA_DIR.glob('*.json')):
+        digest.update(schema.read_bytes())
+    return digest.hexdigest()
+
+
+def load_validated_cache(fingerprint: str) -> dict[str, dict]:
+    """Load 'blob SHA:path' -> {result, timestamp} entries for this validator version."""
+    try:
+        data = json.loads(VALIDATED_CACHE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('fingerprint') != fingerprint:
+        return {}
+    return data.get('entries', {})
+
+
+def save_validated_cache(fingerprint: str, entries: dict[str, dict]) -> None:
+    """Atomically write the cache (temp file + rename); failures are ignored."""
+    if len(entries) > VALIDATED_CACHE_MAX_ENTRIES:
+        newest = sorted(entries.items(), key=lambda item: item[1]['timestamp'], reverse=True)
+        entries = dict(newest[:VALIDATED_CACHE_MAX_ENTRIES])
+    try:
+        VALIDATED_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        # Uniquely named temp file so concurrent hook runs never write into each other's copy
+        tmp_file = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=VALIDATED_CACHE.parent,
+                                               prefix=f'.{VALIDATED_CACHE.name}.', suffix='.tmp', delete=False)
+        try:
+            with tmp_file:
+                tmp_file.write(json.dumps({'fingerprint': fingerprint, 'entries': entries}))
+            os.replace(tmp_file.name, VALIDATED_CACHE)
+        except BaseException:
+            os.unlink(tmp_file.name)
+            raise
+    except OSError:
+        pass
+
+
+class StagedBlobReader:
+    """Read staged blobs through one long-lived ``git cat-file --batch`` process.
+
+    Avoids a fork/exec per file and returns exactly what will be committed,
+    which may differ from the working tree under partial staging.
+    """
+
+    def __init__(self) -> None:
+        self._proc = subprocess.Popen(
+            ['git', 'cat-file', '--batch'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=ROOT
+        )
+
+    def read(self, object_name: str) -> bytes | None:
+        """Return blob content for ``object_name`` (a blob SHA), None if missing."""
+        self._proc.stdin.write(object_name.encode('utf-8') + b'\n')
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline().split()
+        if len(header) != 3:
+            return None  # '<object> missing' / ambiguous
+        data = self._proc.stdout.read(int(header[2]))
+        self._proc.stdout.read(1)  # trailing LF
+        return data
+
+    def close(self) -> None:
+        self._proc.stdin.close()
+        self._proc.wait()
+
+    def __enter__(self) -> StagedBlobReader:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# Staged markdown files inside phase directories (01-* .. 09-*), excluding
+# READMEs and templates. Filtering happens in git's pathspec engine.
+SPEC_PATHSPECS = [
+    ':(glob)**/0[1-9]-*/**/*.md',
+    ':(exclude,icase,glob)**/*readme*',
+    ':(exclude,icase,glob)**/*template*',
+]
+SPEC_DIR_RE = re.compile(r'(?:^|/)0[1-9]-[^/]*/')
+
+
+def get_staged_spec_files() -> list[tuple[Path, str]]:
+    """Get (path, staged blob SHA) for staged markdown files that might be specs."""
     try:
         result = subprocess.run(
-            ['git', 'diff', '--cached', '--name-only', '--diff-filter=ACM'],
+            ['git', 'diff', '--cached', '--raw', '-z', '--no-abbrev', '--no-renames', '--diff-filter=ACM', '--'] + SPEC_PATHSPECS,
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            cwd=ROOT
         )
         
-        staged_files = result.stdout.strip().split('\n')
-        
-        # Filter for markdown files in phase directories
-        spec_files = []
-        for file_str in staged_files:
-            if not file_str:
-                continue
-            
-            file_path = ROOT / file_str
-            
-            # Skip if not markdown
-            if not file_path.suffix == '.md':
-                continue
-            
-            # Skip READMEs and templates
-            name_lower = file_path.name.lower()
-            if 'readme' in name_lower or 'template' in name_lower:
-                continue
-            
-            # Check if in phase directory
-            parts = file_path.parts
-            if any(p.startswith(('01-', '02-', '03-', '04-', '05-', '06-', '07-', '08-', '09-')) for p in parts):
-                spec_files.append(file_path)
-        
-        return spec_files
+        # Records are ':<old mode> <new mode> <old sha> <new sha> <status>\0<path>\0'
+        fields = result.stdout.split('\0')
+        return [
+            (ROOT / path, meta.split()[3])
+            for meta, path in zip(fields[0::2], fields[1::2])
+            if meta
+        ]
     
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to get staged files: {e}", file=sys.stderr)
         return []
 
 
-def main() -> int:
-    """Validate staged spec files."""
+def is_spec_path(rel_path: str) -> bool:
+    """Python equivalent of SPEC_PATHSPECS for a repo-relative POSIX path."""
+    directory, _, name = rel_path.rpartition('/')
+    name = name.lower()
+    return (
+        name.endswith('.md')
+        and 'readme' not in name
+        and 'template' not in name
+        and SPEC_DIR_RE.search(directory + '/') is not None
+    )
+
+
+def main(staged_files: list[tuple[Path, str]] | None = None) -> int:
+    """Validate staged spec files (``staged_files`` defaults to the git index)."""
     print("🔍 Validating staged specification files...")
     
-    staged_files = get_staged_spec_files()
+    if staged_files is None:
+        staged_files = get_staged_spec_files()
     
     if not staged_files:
         print("✅ No spec files to validate")
@@ -94,31 +195,54 @@ def main() -> int:
     all_issues: list[ValidationIssue] = []
     validated_count = 0
     
-    for file_path in staged_files:
-        if not file_path.exists():
-            continue
-        
-        print(f"  Checking: {file_path.relative_to(ROOT)}")
-        
-        try:
-            issues, warnings = validate_spec(file_path)
-            
-            # Print warnings
-            for warning in warnings:
-                print(f"    ⚠️  {warning}")
+    fingerprint = validator_fingerprint()
+    validated = load_validated_cache(fingerprint)
+    cache_updated = False
+    
+    with StagedBlobReader() as blobs:
+        for file_path, blob_sha in staged_files:
+            rel_path = file_path.relative_to(ROOT)
+            cache_key = f"{blob_sha}:{rel_path.as_posix()}"
             
-            # Collect errors
-            if issues:
-                for issue in issues:
-                    print(f"    ❌ {issue.message}")
-                all_issues.extend(issues)
-            else:
-                print(f"    ✅ Valid")
+            if validated.get(cache_key, {}).get('result') == 'ok':
+                print(f"  Checking: {rel_path}")
+                print(f"    ✅ Valid (cached)")
                 validated_count += 1
-        
-        except Exception as e:
-            print(f"    ❌ Validation error: {e}")
-            all_issues.append(ValidationIssue(file_path, str(e)))
+                continue
+            
+            print(f"  Checking: {rel_path}")
+            
+            data = blobs.read(blob_sha)
+            if data is None:
+                message = f"could not read staged blob {blob_sha} for {rel_path.as_posix()}"
+                print(f"    ❌ {message}")
+                all_issues.append(ValidationIssue(file_path, message))
+                continue
+            
+            try:
+                issues, warnings = validate_spec_bytes(file_path, data)
+                
+                # Print warnings
+                for warning in warnings:
+                    print(f"    ⚠️  {warning}")
+                
+                # Collect errors
+                if issues:
+                    for issue in issues:
+                        print(f"    ❌ {issue.message}")
+                    all_issues.extend(issues)
+                else:
+                    print(f"    ✅ Valid")
+                    validated_count += 1
+                    validated[cache_key] = {'result': 'ok', 'timestamp': time.time()}
+                    cache_updated = True
+            
+            except Exception as e:
+                print(f"    ❌ Validation error: {e}")
+                all_issues.append(ValidationIssue(file_path, str(e)))
+    
+    if cache_updated:
+        save_validated_cache(fingerprint, validated)
     
     print()
     print("=" * 60)
@@ -15,38 +15,39 @@ Or use with pre-commit framework:
     pre-commit install
 """
 
+import re
 import sys
 import subprocess
-from pathlib import Path
 
-def main():
-    """Pre-commit hook main function."""
-    
-    # Get list of staged files
-    result = subprocess.run(['git', 'diff', '--cached', '--name-only'], 
-                           capture_output=True, text=True)
-    
-    if result.returncode != 0:
-        print("❌ Failed to get staged files")
-        return 1
+# Specification paths to validate, and paths to leave alone (case-insensitive)
+_INCLUDE_RE = re.compile(r'(?:02-requirements|03-architecture|04-design|spec\.md|specification\.md|architecture\.md)', re.I)
+_EXCLUDE_RE = re.compile(r'(?:readme\.md|template|\.github|examples)', re.I)
+
+AUTOFIX_SCRIPT = 'Scripts/autofix-spec-compliance.py'
+
+def main(staged_files=None):
+    """Pre-commit hook main function (``staged_files`` defaults to the git index)."""
     
-    staged_files = result.stdout.strip().split('\n')
-    if not staged_files or staged_files == ['']:
+    if staged_files is None:
+        # Get list of staged (added/copied/modified) markdown files; git's pathspec engine does the filtering
+        result = subprocess.run(['git', 'diff', '--cached', '--name-only', '-z', '--diff-filter=ACM', '--', '*.md'], 
+                               capture_output=True, text=True)
+        
+        if result.returncode != 0:
+            print("❌ Failed to get staged files")
+            return 1
+        
+        staged_files = [f for f in result.stdout.split('\0') if f]
+    if not staged_files:
         return 0  # No files staged
     
     # Filter specification files
-    spec_files = []
-    for file_path in staged_files:
-        path = Path(file_path)
-        if (path.suffix == '.md' and 
-            any(pattern in str(path).lower() for pattern in [
-                '02-requirements', '03-architecture', '04-design', 
-                'spec.md', 'specification.md', 'architecture.md'
-            ]) and
-            not any(pattern in str(path).lower() for pattern in [
-                'readme.md', 'template', '.github', 'examples'
-            ])):
-            spec_files.append(file_path)
+    spec_files = [
+        file_path for file_path in staged_files
+        if file_path.endswith('.md')
+        and _INCLUDE_RE.search(file_path)
+        and not _EXCLUDE_RE.search(file_path)
+    ]
     
     if not spec_files:
         return 0  # No specification files staged
@@ -54,7 +55,7 @@ def main():
     print(f"🔍 Validating {len(spec_files)} specification files...")
     
     # Run compliance validation and auto-fix
-    cmd = [sys.executable, 'Scripts/autofix-spec-compliance.py'] + spec_files
+    cmd = [sys.executable, AUTOFIX_SCRIPT] + spec_files
     result = subprocess.run(cmd, capture_output=True, text=True)
     
     if result.returncode != 0:
@@ -62,12 +63,13 @@ def main():
         print(result.stdout)
         print(result.stderr)
         print("\n💡 Run this command to auto-fix issues:")
-        print(f"   python Scripts/autofix-spec-compliance.py {' '.join(spec_files)}")
+        print(f"   python {AUTOFIX_SCRIPT} {' '.join(spec_files)}")
         return 1
     
-    # Check if any files were modified by auto-fix
-    result = subprocess.run(['git', 'diff', '--name-only'] + spec_files,
-                           capture_output=True, text=True)
+    # Check if any of the validated files were modified by auto-fix
+    result = subprocess.run(['git', 'diff', '--name-only', '--'] + spec_files,
+                           stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                           text=True, check=False)
     
     if result.stdout.strip():
         modified_files = result.stdout.strip().split('\n')
@@ -77,7 +79,8 @@ def main():
             print(f"   - {file_path}")
         
         # Add modified files back to staging
-        subprocess.run(['git', 'add'] + modified_files)
+        subprocess.run(['git', 'add', '--'] + modified_files,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
         print("🚀 Auto-fixes staged for commit")
     
     print("✅ All specification files are compliant!")
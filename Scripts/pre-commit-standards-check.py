@@ -4,25 +4,43 @@ Pre-commit hook for standards compliance enforcement
 Validates all spec files before commit per ISO/IEC/IEEE standards
 """
 
+import io
 import sys
-import subprocess
 import pathlib
+import contextlib
+import importlib.util
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+def load_spec_validator():
+    """Import validate-spec-structure.py in-process (reused if already loaded)"""
+    module_name = 'validate_spec_structure'
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(
+        module_name, ROOT / 'Scripts' / 'validate-spec-structure.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[module_name] = module
+    return module
 
 def run_validation():
     """Run the existing validation script with enhanced output"""
+    stdout, stderr = io.StringIO(), io.StringIO()
     try:
-        result = subprocess.run([
-            sys.executable, 
-            'Scripts/validate-spec-structure.py'
-        ], capture_output=True, text=True, cwd=pathlib.Path(__file__).parent.parent)
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                returncode = load_spec_validator().main(['validate-spec-structure.py'])
+            except SystemExit as e:  # missing dependency during import
+                returncode = e.code
         
-        if result.returncode != 0:
+        if returncode != 0:
             print("🚫 PRE-COMMIT BLOCKED: Standards compliance issues found!")
             print("\n" + "="*60)
             print("STANDARDS COMPLIANCE VALIDATION FAILED")
             print("="*60)
-            print(result.stdout)
-            print(result.stderr)
+            print(stdout.getvalue())
+            print(stderr.getvalue())
             print("\n💡 FIX GUIDANCE:")
             print("1. Review the validation errors above")
             print("2. Fix YAML front matter in flagged files")
@@ -38,7 +56,7 @@ def run_validation():
             return False
         else:
             print("✅ Standards compliance validated - commit allowed")
-            print(result.stdout)
+            print(stdout.getvalue())
             return True
             
     except Exception as e:
@@ -14,18 +14,94 @@ Exit Codes:
 """
 
 import sys
+import os
+import json
+import hashlib
+import tempfile
 import subprocess
+from bisect import bisect_right
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set, Tuple
 import re
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# Specification files requiring traceability, by lifecycle phase folder
+_SPEC_PATTERNS = [re.compile(p) for p in (
+    r'01-stakeholder.*\.md$',
+    r'02-requirements.*\.md$',
+    r'03-architecture.*\.md$',
+    r'04-design.*\.md$',
+    r'05-implementation.*\.md$',
+    r'07-verification.*\.md$',
+)]
+
+# Requirement ID references (REQ-F-001, REQ-NF-1234, ...)
+_REQ_RE = re.compile(r'\b(REQ-[FN]F?-\d{3,4})\b')
+
+# Valid requirement ID format: functional or non-functional
+_REQ_FMT_RE = re.compile(r'^REQ-(?:F|NF)-\d{3,4}$')
+
+# Folders scanned for requirement definitions
+_REQ_DIRS = [
+    '02-requirements/functional/',
+    '02-requirements/non-functional/',
+    '01-stakeholder-requirements/',
+]
+
+# Requirement index caches kept in .git/spec-cache (one per requirements tree state)
+_REQ_CACHE_KEEP = 8
+
+# Violation record: (file path, line number, code, message arguments).
+# Records are formatted only when reported.
+Violation = Tuple[Optional[str], Optional[int], str, tuple]
+
+_VIOLATION_FORMATS = {
+    'FILE_NOT_FOUND': 'File not found: {file}',
+    'PROCESSING_ERROR': 'Error processing {file}: {0}',
+    'MISSING_FRONT_MATTER': '{file}: Missing YAML front matter',
+    'MALFORMED_FRONT_MATTER': '{file}: Malformed YAML front matter',
+    'MISSING_TRACEABILITY': '{file}: Missing traceability section in YAML',
+    'YAML_ERROR': '{file}: YAML parsing error - {0}',
+    'MISSING_TRACE_FIELD': '{file}: Missing {0} traceability',
+    'EMPTY_TRACE_FIELD': '{file}: {0} must be non-empty list',
+    'BAD_REQ_ID': '{file}:{line}: Invalid requirement ID format: {0}',
+    'UNDEFINED_REQ': '{file}:{line}: Undefined requirement reference: {0}',
+    'MISSING_TRACE_SECTION': '{file}: Missing Traceability section',
+    'ORPHANED_REQUIREMENTS': 'New orphaned requirements detected',
+}
+
+def _format_violation(violation: Violation) -> str:
+    """Render a violation record as a human-readable message"""
+    file_path, line_num, code, args = violation
+    return _VIOLATION_FORMATS[code].format(*args, file=file_path, line=line_num)
+
+def _iter_md(root: str):
+    """Yield paths of *.md files below root (os.scandir walk, no Path objects)"""
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.md'):
+                    yield entry.path
+
 class PreCommitTraceabilityValidator:
     """Pre-commit hook for traceability validation"""
     
     def __init__(self):
         self.repo_root = Path(__file__).parent.parent
-        self.violations: List[str] = []
+        self.violations: List[Violation] = []
+        self._req_index: Optional[Set[str]] = None
         
     def validate_modified_files(self, files: List[str]) -> bool:
         """Validate traceability for modified files"""
@@ -40,6 +116,9 @@ class PreCommitTraceabilityValidator:
             
         print(f"📄 Checking {len(spec_files)} specification files...")
         
+        # Start the repository-wide orphan check; it runs while files are validated
+        orphan_check = self._start_orphan_check()
+        
         # Run comprehensive validation
         success = True
         
@@ -48,7 +127,7 @@ class PreCommitTraceabilityValidator:
                 success = False
                 
         # Check for newly introduced orphaned requirements
-        if not self._check_orphaned_requirements(spec_files):
+        if not self._check_orphaned_requirements(orphan_check):
             success = False
             
         # Report results
@@ -57,24 +136,15 @@ class PreCommitTraceabilityValidator:
         else:
             print("❌ Traceability violations detected:")
             for violation in self.violations:
-                print(f"  - {violation}")
+                print(f"  - {_format_violation(violation)}")
             print("\nℹ️  Fix violations or use --no-verify to bypass (not recommended)")
             
         return success
         
     def _is_spec_file(self, file_path: str) -> bool:
         """Check if file is a specification file requiring traceability"""
-        spec_patterns = [
-            r'01-stakeholder.*\.md$',
-            r'02-requirements.*\.md$',
-            r'03-architecture.*\.md$',
-            r'04-design.*\.md$',
-            r'05-implementation.*\.md$',
-            r'07-verification.*\.md$',
-        ]
-        
-        for pattern in spec_patterns:
-            if re.search(pattern, file_path):
+        for pattern in _SPEC_PATTERNS:
+            if pattern.search(file_path):
                 return True
         return False
         
@@ -83,19 +153,18 @@ class PreCommitTraceabilityValidator:
         abs_path = self.repo_root / file_path
         
         if not abs_path.exists():
-            self.violations.append(f"File not found: {file_path}")
+            self.violations.append((file_path, None, 'FILE_NOT_FOUND', ()))
             return False
             
         try:
             with open(abs_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-                lines = content.split('\n')
                 
             # Validate YAML front matter traceability
-            yaml_valid = self._validate_yaml_traceability(lines, file_path)
+            yaml_valid = self._validate_yaml_traceability(content, file_path)
             
             # Validate inline requirement references
-            inline_valid = self._validate_inline_references(lines, file_path)
+            inline_valid = self._validate_inline_references(content, file_path)
             
             # Check for required traceability sections
             sections_valid = self._validate_traceability_sections(content, file_path)
@@ -103,33 +172,40 @@ class PreCommitTraceabilityValidator:
             return yaml_valid and inline_valid and sections_valid
             
         except Exception as e:
-            self.violations.append(f"Error processing {file_path}: {e}")
+            self.violations.append((file_path, None, 'PROCESSING_ERROR', (e,)))
             return False
             
-    def _validate_yaml_traceability(self, lines: List[str], file_path: str) -> bool:
+    def _validate_yaml_traceability(self, content: str, file_path: str) -> bool:
         """Validate YAML front matter traceability"""
-        if not lines or lines[0].strip() != '---':
-            self.violations.append(f"{file_path}: Missing YAML front matter")
+        first_end = content.find('\n')
+        if content[:first_end if first_end != -1 else len(content)].strip() != '---':
+            self.violations.append((file_path, None, 'MISSING_FRONT_MATTER', ()))
             return False
             
-        # Find YAML section
+        # Find YAML section by walking line offsets, without splitting the file
+        yaml_start = first_end + 1
         yaml_end = -1
-        for i, line in enumerate(lines[1:], 1):
-            if line.strip() == '---':
-                yaml_end = i
+        pos = yaml_start if first_end != -1 else len(content)
+        while pos < len(content):
+            line_end = content.find('\n', pos)
+            if line_end == -1:
+                line_end = len(content)
+            if content[pos:line_end].strip() == '---':
+                yaml_end = pos
                 break
+            pos = line_end + 1
                 
         if yaml_end == -1:
-            self.violations.append(f"{file_path}: Malformed YAML front matter")
+            self.violations.append((file_path, None, 'MALFORMED_FRONT_MATTER', ()))
             return False
             
         try:
-            yaml_content = '\n'.join(lines[1:yaml_end])
-            yaml_data = yaml.safe_load(yaml_content)
+            yaml_content = content[yaml_start:yaml_end]
+            yaml_data = yaml.load(yaml_content, Loader=SafeLoader)
             
             # Check for required traceability section
             if 'traceability' not in yaml_data:
-                self.violations.append(f"{file_path}: Missing traceability section in YAML")
+                self.violations.append((file_path, None, 'MISSING_TRACEABILITY', ()))
                 return False
                 
             traceability = yaml_data['traceability']
@@ -138,7 +214,7 @@ class PreCommitTraceabilityValidator:
             return self._validate_traceability_structure(traceability, file_path)
             
         except yaml.YAMLError as e:
-            self.violations.append(f"{file_path}: YAML parsing error - {e}")
+            self.violations.append((file_path, None, 'YAML_ERROR', (e,)))
             return False
             
     def _validate_traceability_structure(self, traceability: dict, file_path: str) -> bool:
@@ -149,23 +225,23 @@ class PreCommitTraceabilityValidator:
         if '02-requirements' in file_path:
             # Requirements should trace to stakeholder requirements
             if 'stakeholderRequirements' not in traceability:
-                self.violations.append(f"{file_path}: Missing stakeholderRequirements traceability")
+                self.violations.append((file_path, None, 'MISSING_TRACE_FIELD', ('stakeholderRequirements',)))
                 valid = False
             else:
                 stakeholder_reqs = traceability['stakeholderRequirements']
                 if not isinstance(stakeholder_reqs, list) or not stakeholder_reqs:
-                    self.violations.append(f"{file_path}: stakeholderRequirements must be non-empty list")
+                    self.violations.append((file_path, None, 'EMPTY_TRACE_FIELD', ('stakeholderRequirements',)))
                     valid = False
                     
         elif '03-architecture' in file_path:
             # Architecture should trace to requirements
             if 'requirements' not in traceability:
-                self.violations.append(f"{file_path}: Missing requirements traceability")
+                self.violations.append((file_path, None, 'MISSING_TRACE_FIELD', ('requirements',)))
                 valid = False
             else:
                 requirements = traceability['requirements']
                 if not isinstance(requirements, list) or not requirements:
-                    self.violations.append(f"{file_path}: requirements must be non-empty list")
+                    self.violations.append((file_path, None, 'EMPTY_TRACE_FIELD', ('requirements',)))
                     valid = False
                     
         elif '04-design' in file_path:
@@ -173,7 +249,7 @@ class PreCommitTraceabilityValidator:
             expected_fields = ['architectureDecisions', 'requirements']
             for field in expected_fields:
                 if field not in traceability:
-                    self.violations.append(f"{file_path}: Missing {field} traceability")
+                    self.violations.append((file_path, None, 'MISSING_TRACE_FIELD', (field,)))
                     valid = False
                     
         elif '07-verification' in file_path:
@@ -181,70 +257,176 @@ class PreCommitTraceabilityValidator:
             expected_fields = ['requirements', 'designElements']
             for field in expected_fields:
                 if field not in traceability:
-                    self.violations.append(f"{file_path}: Missing {field} traceability")
+                    self.violations.append((file_path, None, 'MISSING_TRACE_FIELD', (field,)))
                     valid = False
                     
         return valid
         
-    def _validate_inline_references(self, lines: List[str], file_path: str) -> bool:
+    def _validate_inline_references(self, content: str, file_path: str) -> bool:
         """Validate inline requirement references"""
         valid = True
+        newline_offsets: Optional[List[int]] = None
         
-        # Find requirement ID references
-        req_pattern = r'\b(REQ-[FN]F?-\d{3,4})\b'
-        
-        for line_num, line in enumerate(lines, 1):
-            matches = re.findall(req_pattern, line)
-            for req_id in matches:
-                # Validate requirement ID format
-                if not self._is_valid_req_id_format(req_id):
-                    self.violations.append(f"{file_path}:{line_num}: Invalid requirement ID format: {req_id}")
-                    valid = False
-                    
-                # Check if requirement exists (simplified check)
-                if not self._requirement_exists(req_id):
-                    self.violations.append(f"{file_path}:{line_num}: Undefined requirement reference: {req_id}")
-                    valid = False
+        # Find requirement ID references in a single scan of the whole file
+        for match in _REQ_RE.finditer(content):
+            if newline_offsets is None:
+                newline_offsets = self._newline_offsets(content)
+            line_num = bisect_right(newline_offsets, match.start()) + 1
+            req_id = match.group(1)
+            
+            # Validate requirement ID format
+            if not self._is_valid_req_id_format(req_id):
+                self.violations.append((file_path, line_num, 'BAD_REQ_ID', (req_id,)))
+                valid = False
+                
+            # Check if requirement exists (simplified check)
+            if not self._requirement_exists(req_id):
+                self.violations.append((file_path, line_num, 'UNDEFINED_REQ', (req_id,)))
+                valid = False
                     
         return valid
         
+    @staticmethod
+    def _newline_offsets(content: str) -> List[int]:
+        """Offsets of every newline in content, for offset -> line number lookup"""
+        offsets = []
+        pos = content.find('\n')
+        while pos != -1:
+            offsets.append(pos)
+            pos = content.find('\n', pos + 1)
+        return offsets
+        
     def _is_valid_req_id_format(self, req_id: str) -> bool:
         """Check if requirement ID follows correct format"""
-        valid_patterns = [
-            r'^REQ-F-\d{3,4}$',    # Functional: REQ-F-001, REQ-F-1234
-            r'^REQ-NF-\d{3,4}$',   # Non-functional: REQ-NF-001, REQ-NF-1234
-        ]
-        
-        for pattern in valid_patterns:
-            if re.match(pattern, req_id):
-                return True
-        return False
+        return _REQ_FMT_RE.match(req_id) is not None
         
     def _requirement_exists(self, req_id: str) -> bool:
         """Check if requirement is defined somewhere in the repository"""
-        # Simplified existence check - in production this would use the 
-        # traceability database or scan specification files
+        if self._req_index is None:
+            self._req_index = self._load_requirement_index()
+        return req_id in self._req_index
+        
+    def _load_requirement_index(self) -> Set[str]:
+        """Load requirement IDs from the hook cache, rebuilding it when stale"""
+        staged = self._staged_requirement_entries()
+        if staged is None:
+            return self._build_requirement_index()
+            
+        # Index and key both come from the staged tree, so unstaged edits can never leak into the cache
+        key = hashlib.sha1(staged).hexdigest()
+        cache_file = self._cache_dir() / f'reqs-{key}.json'
+        if cache_file.exists():
+            try:
+                return set(json.loads(cache_file.read_text(encoding='utf-8')))
+            except (OSError, ValueError):
+                pass
+                
+        index = self._build_staged_requirement_index(staged)
+        self._write_cache(cache_file, sorted(index))
+        self._prune_requirement_caches()
+            
+        return index
         
-        # Check common requirement files
-        req_files = [
-            '02-requirements/functional/',
-            '02-requirements/non-functional/',
-            '01-stakeholder-requirements/',
-        ]
+    def _prune_requirement_caches(self) -> None:
+        """Keep only the most recently written requirement index caches"""
+        try:
+            caches = sorted(self._cache_dir().glob('reqs-*.json'),
+                            key=lambda p: p.stat().st_mtime, reverse=True)
+            for stale in caches[_REQ_CACHE_KEEP:]:
+                stale.unlink()
+        except OSError:
+            pass
+        
+    def _build_requirement_index(self) -> Set[str]:
+        """Scan requirement folders once and collect every requirement ID"""
+        index: Set[str] = set()
         
-        for req_dir in req_files:
+        for req_dir in _REQ_DIRS:
             req_path = self.repo_root / req_dir
             if req_path.exists():
-                for md_file in req_path.glob('**/*.md'):
+                for md_file in _iter_md(str(req_path)):
                     try:
                         with open(md_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            if req_id in content:
-                                return True
+                            index.update(_REQ_RE.findall(f.read()))
                     except:
                         continue
                         
-        return False
+        return index
+        
+    def _build_staged_requirement_index(self, staged: bytes) -> Set[str]:
+        """Collect every requirement ID from the staged requirement files
+
+        Reads the blobs listed by _staged_requirement_entries through one
+        ``git cat-file --batch`` call, i.e. exactly what is being committed.
+        """
+        blob_shas = []
+        for record in staged.split(b'\0'):
+            if not record:
+                continue
+            meta, _, path = record.partition(b'\t')
+            mode, sha, _ = meta.split(b' ', 2)
+            if path.endswith(b'.md') and mode != b'160000':
+                blob_shas.append(sha)
+        if not blob_shas:
+            return set()
+            
+        try:
+            result = subprocess.run(['git', 'cat-file', '--batch'], input=b'\n'.join(blob_shas) + b'\n',
+                                  capture_output=True, cwd=self.repo_root, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            return self._build_requirement_index()
+            
+        # Output is '<sha> blob <size>\n<content>\n' per blob ('<sha> missing\n' if absent)
+        index: Set[str] = set()
+        out = result.stdout
+        pos = 0
+        while pos < len(out):
+            header_end = out.index(b'\n', pos)
+            header = out[pos:header_end].split()
+            pos = header_end + 1
+            if len(header) != 3:
+                continue
+            size = int(header[2])
+            try:
+                index.update(_REQ_RE.findall(out[pos:pos + size].decode('utf-8')))
+            except UnicodeDecodeError:
+                pass
+            pos += size + 1
+            
+        return index
+        
+    def _staged_requirement_entries(self) -> Optional[bytes]:
+        """``git ls-files -s`` records for the requirement folders (None outside git)
+
+        Unlike HEAD:<dir>, this covers requirements staged in the same commit.
+        """
+        try:
+            result = subprocess.run(['git', 'ls-files', '-s', '-z', '--'] + _REQ_DIRS,
+                                  capture_output=True, cwd=self.repo_root, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return result.stdout
+        
+    def _cache_dir(self) -> Path:
+        """Per-clone cache folder for hook results (.git/spec-cache)"""
+        return self.repo_root / '.git' / 'spec-cache'
+        
+    def _write_cache(self, cache_file: Path, data) -> None:
+        """Atomically write a cache file; caching failures never block a commit"""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Uniquely named temp file so concurrent hook runs never write into each other's copy
+            tmp_file = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_file.parent,
+                                                   prefix=f'.{cache_file.name}.', suffix='.tmp', delete=False)
+            try:
+                with tmp_file:
+                    tmp_file.write(json.dumps(data))
+                os.replace(tmp_file.name, cache_file)
+            except BaseException:
+                os.unlink(tmp_file.name)
+                raise
+        except OSError:
+            pass
         
     def _validate_traceability_sections(self, content: str, file_path: str) -> bool:
         """Validate presence of required traceability sections"""
@@ -253,28 +435,41 @@ class PreCommitTraceabilityValidator:
         # Check for traceability section in content
         if '## Traceability' not in content and '# Traceability' not in content:
             if '03-architecture' in file_path or '04-design' in file_path:
-                self.violations.append(f"{file_path}: Missing Traceability section")
+                self.violations.append((file_path, None, 'MISSING_TRACE_SECTION', ()))
                 valid = False
                 
         return valid
         
-    def _check_orphaned_requirements(self, modified_files: List[str]) -> bool:
-        """Check for newly introduced orphaned requirements"""
-        print("🔍 Checking for orphaned requirements...")
-        
+    def _start_orphan_check(self) -> Optional[subprocess.Popen]:
+        """Launch the orphan check in the background (None if it cannot start)"""
         try:
             # Run quick orphan check using the main traceability enforcer
-            result = subprocess.run([
+            return subprocess.Popen([
                 sys.executable, 
                 str(self.repo_root / 'Scripts' / 'enforce-traceability.py'),
                 '--validate-all',
                 '--repo-root', str(self.repo_root)
-            ], capture_output=True, text=True)
+            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            
+        except Exception as e:
+            print(f"⚠️  Could not run orphan check: {e}")
+            # Don't fail commit for infrastructure issues
+            return None
+        
+    def _check_orphaned_requirements(self, orphan_check: Optional[subprocess.Popen]) -> bool:
+        """Check for newly introduced orphaned requirements"""
+        print("🔍 Checking for orphaned requirements...")
+        
+        if orphan_check is None:
+            return True
+            
+        try:
+            stdout, _ = orphan_check.communicate()
             
-            if result.returncode != 0:
+            if orphan_check.returncode != 0:
                 # Parse output for orphan count
-                if 'orphaned requirements' in result.stdout:
-                    self.violations.append("New orphaned requirements detected")
+                if 'orphaned requirements' in stdout:
+                    self.violations.append((None, None, 'ORPHANED_REQUIREMENTS', ()))
                     return False
                     
         except Exception as e:
@@ -294,9 +489,11 @@ def main():
     else:
         # Get staged files from git
         try:
-            result = subprocess.run(['git', 'diff', '--cached', '--name-only'], 
-                                  capture_output=True, text=True, check=True)
-            files = result.stdout.strip().split('\n') if result.stdout.strip() else []
+            # Let git's pathspec engine drop non-markdown files; deleted files have nothing to trace
+            result = subprocess.run(['git', 'diff', '--cached', '--name-only', '-z', '--diff-filter=ACM', '--', '*.md'], 
+                                  capture_output=True, text=True, check=True,
+                                  cwd=validator.repo_root)
+            files = [f for f in result.stdout.split('\0') if f]
         except subprocess.CalledProcessError:
             print("⚠️  Could not get staged files from git")
             files = []
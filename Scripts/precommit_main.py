@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Single git pre-commit hook entry point for the specification hooks.
+
+Runs the spec hooks that are otherwise installed one by one as
+.git/hooks/pre-commit in one interpreter, instead of starting a fresh Python
+process per hook:
+  1. pre-commit-spec-compliance.py  - auto-fix (when the auto-fix script exists)
+  2. pre-commit-hook.py             - staged spec structure / schema validation
+  3. pre-commit-standards-check.py  - repository standards compliance
+  4. pre-commit-traceability.py     - traceability validation
+
+All phases share one list of staged markdown files read from git. Only the
+traceability phase needs the requirement index; it builds (and caches) it once.
+
+This is not used by .pre-commit-config.yaml, whose validate-spec-structure and
+standards-compliance-check hooks stay as they are; installing this hook opts
+in to the auto-fix and traceability gates as well.
+
+Install (the hook must run from the repository, not from .git/hooks):
+  printf '#!/bin/sh\\nexec python Scripts/precommit_main.py\\n' > .git/hooks/pre-commit
+  chmod +x .git/hooks/pre-commit
+
+Usage:
+  python Scripts/precommit_main.py
+
+Exit codes:
+ 0 all phases passed
+ 1 at least one phase failed
+"""
+from __future__ import annotations
+import sys
+import subprocess
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ROOT / 'Scripts'
+
+
+def load_script(file_name: str) -> ModuleType:
+    """Import a hyphen-named script from Scripts/ as a module."""
+    module_name = file_name[:-3].replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS / file_name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_staged_files() -> tuple[tuple[str, str], ...]:
+    """Staged (added/copied/modified) markdown files as (repo path, blob SHA)."""
+    result = subprocess.run(
+        ['git', 'diff', '--cached', '--raw', '-z', '--no-abbrev', '--no-renames',
+         '--diff-filter=ACM', '--', '*.md'],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT
+    )
+    # Records are ':<old mode> <new mode> <old sha> <new sha> <status>\0<path>\0'
+    fields = result.stdout.split('\0')
+    return tuple(
+        (path, meta.split()[3])
+        for meta, path in zip(fields[0::2], fields[1::2])
+        if meta
+    )
+
+
+def main() -> int:
+    try:
+        staged = get_staged_files()
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to get staged files: {e}", file=sys.stderr)
+        return 1
+
+    failed = False
+
+    # Phase 1: auto-fix may re-stage files, so refresh the shared list afterwards
+    compliance = load_script('pre-commit-spec-compliance.py')
+    if (ROOT / compliance.AUTOFIX_SCRIPT).exists():
+        failed |= compliance.main([path for path, _ in staged]) != 0
+        staged = get_staged_files()
+    else:
+        print(f"ℹ️  {compliance.AUTOFIX_SCRIPT} not found, skipping specification auto-fix")
+
+    # Phase 2: staged spec structure
+    hook = load_script('pre-commit-hook.py')
+    failed |= hook.main([(ROOT / path, sha) for path, sha in staged if hook.is_spec_path(path)]) != 0
+
+    # Phase 3: repository standards compliance
+    standards = load_script('pre-commit-standards-check.py')
+    failed |= not standards.run_validation()
+
+    # Phase 4: traceability
+    traceability = load_script('pre-commit-traceability.py')
+    files = [path for path, _ in staged]
+    if files:
+        failed |= not traceability.PreCommitTraceabilityValidator().validate_modified_files(files)
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
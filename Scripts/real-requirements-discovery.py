@@ -12,16 +12,96 @@ NO MORE FAKE HARDCODED VALUES - ONLY REAL REPOSITORY ANALYSIS
 import os
 import re
 import json
+import heapq
 import yaml
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, FrozenSet, List, Set, Tuple, Optional
+from dataclasses import dataclass, field, fields
 import logging
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+
+try:
+    import ahocorasick  # pyahocorasick: optional, speeds up keyword extraction
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # optional, speeds up writing the report
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Requirement definition line: REQ-XXX-YYY-NNN: title (any line of a document,
+# surrounding whitespace ignored)
+_REQ_LINE = re.compile(r'^[^\S\n]*(REQ-[A-Z]+-[A-Z0-9]+-[0-9]+):[^\S\n]*(\S.*?)[^\S\n]*$', re.MULTILINE)
+_REQ_PREFIX = re.compile(r'^REQ-[A-Z]+-[A-Z0-9]+-[0-9]+:')
+
+# YAML front matter block followed by the document body
+_YAML_FM = re.compile(r'^---\n(.*?)\n---\n(.*)$', re.DOTALL)
+
+# Standard references inside (lower-cased) text
+_IEEE_RE = re.compile(r'ieee[- ]?(\d+(?:\.\d+)?)')
+_AES_RE = re.compile(r'aes[- ]?(\d+)')
+
+# Filename tokens mapped to standards, checked in order
+# ('ieee-1722.1' precedes 'ieee-1722' so the longer token wins)
+_STD_TOKENS = (
+    ('ieee-1722.1', 'IEEE-1722.1'),
+    ('ieee-1722', 'IEEE-1722'),
+    ('ieee-1588', 'IEEE-1588'),
+    ('ieee-802.1as', 'IEEE-802.1AS'),
+    ('ieee-802.1ab', 'IEEE-802.1AB'),
+    ('ieee-802.1ax', 'IEEE-802.1AX'),
+    ('aes67', 'AES67'),
+    ('aes70', 'AES70'),
+    ('aes3', 'AES3'),
+    ('aes5', 'AES5'),
+    ('aes60', 'AES60'),
+)
+
+# Technical domain keywords
+_DOMAIN_KEYWORDS = {
+    'timing': ['synchronization', 'timing', 'clock', 'sync', 'precision', 'accuracy', 'delay', 'jitter'],
+    'audio': ['audio', 'stream', 'channel', 'sampling', 'frequency', 'format', 'codec'],
+    'network': ['ethernet', 'packet', 'transmission', 'protocol', 'layer', 'frame'],
+    'control': ['control', 'command', 'response', 'management', 'configuration'],
+    'discovery': ['discovery', 'advertisement', 'announce', 'available', 'entity'],
+    'quality': ['quality', 'performance', 'latency', 'throughput', 'reliability'],
+    'security': ['security', 'authentication', 'encryption', 'authorization'],
+    'compatibility': ['compatibility', 'interoperability', 'compliance', 'standard']
+}
+_ALL_KEYWORDS = tuple(keyword for keywords in _DOMAIN_KEYWORDS.values() for keyword in keywords)
+
+# Technical terms that score when shared by architecture and requirement text
+_TECHNICAL_TERMS = ('protocol', 'message', 'packet', 'stream', 'entity', 'descriptor',
+                    'command', 'response', 'synchronization', 'timing', 'audio')
+
+# Below this many files, process pool start-up costs more than it saves
+_PARALLEL_MIN_FILES = 32
+
+def _technical_term_mask(text_lower: str) -> int:
+    """Bitmask of the _TECHNICAL_TERMS occurring in lower-cased text"""
+    mask = 0
+    for bit, term in enumerate(_TECHNICAL_TERMS):
+        if term in text_lower:
+            mask |= 1 << bit
+    return mask
+
+def _mask_bits(mask: int) -> List[int]:
+    """Indices of the bits set in mask"""
+    return [bit for bit in range(mask.bit_length()) if mask >> bit & 1]
+
 @dataclass
 class Requirement:
     """Real requirement extracted from repository files"""
@@ -31,8 +111,16 @@ class Requirement:
     source_file: str
     category: str  # functional, non-functional, stakeholder
     standard: str  # IEEE-1722.1, AES67, etc.
-    keywords: List[str]
+    keywords: FrozenSet[str]
     line_number: int
+    # Derived scoring data (not part of the report): bit k set iff _TECHNICAL_TERMS[k] occurs
+    tech_mask: int = field(default=0, repr=False, metadata={'derived': True})
+    # Keyword set as a bitmask and title words as ids, over the mapping
+    # vocabularies (see _encode_scoring_features)
+    keyword_mask: int = field(default=0, repr=False, metadata={'derived': True})
+    title_tokens: FrozenSet[int] = field(default=frozenset(), repr=False, metadata={'derived': True})
+    # Standard lower-cased without '.' and '-', as matched against architecture filenames
+    standard_key: str = field(default='', repr=False, metadata={'derived': True})
 
 @dataclass
 class ArchitectureComponent:
@@ -40,14 +128,24 @@ class ArchitectureComponent:
     file_path: str
     title: str
     content: str
-    keywords: List[str]
+    keywords: FrozenSet[str]
     current_requirements: List[str]
+    # Parsed front matter ({} when the file has none, None when it is unparseable)
+    # and full body, kept so header updates need not re-read the file
+    raw_yaml: Optional[dict] = field(default=None, repr=False)
+    body: str = field(default='', repr=False)
+    tech_mask: int = field(default=0, repr=False)
+    keyword_mask: int = field(default=0, repr=False)
+    title_tokens: FrozenSet[int] = field(default=frozenset(), repr=False)
+    # File name lower-cased without '-', as matched against requirement standards
+    filename_key: str = field(default='', repr=False)
 
 class RealRequirementsDiscovery:
     def __init__(self, repo_root: str):
         self.repo_root = Path(repo_root)
         self.requirements: Dict[str, Requirement] = {}
         self.architecture_files: Dict[str, ArchitectureComponent] = {}
+        self._keyword_automaton = self._build_keyword_automaton()
         
     def discover_all_requirements(self) -> Dict[str, Requirement]:
         """Scan ALL requirement files and extract REAL requirements"""
@@ -56,21 +154,52 @@ class RealRequirementsDiscovery:
         requirements_dir = self.repo_root / "02-requirements"
         
         # Scan all markdown files in requirements directory
-        for req_file in requirements_dir.rglob("*.md"):
-            if req_file.name in ["README.md", "TEMPLATE.md", "ID-NAMING-CONVENTION-MIGRATION.md"]:
-                continue
-                
+        req_files = [
+            req_file for req_file in requirements_dir.rglob("*.md")
+            if req_file.name not in ["README.md", "TEMPLATE.md", "ID-NAMING-CONVENTION-MIGRATION.md"]
+        ]
+        
+        for req_file, file_requirements in zip(req_files, self._map_files('_parse_requirements_file', req_files)):
             logger.info(f"📄 Analyzing: {req_file.relative_to(self.repo_root)}")
-            self._extract_requirements_from_file(req_file)
+            self._add_requirements(file_requirements)
         
         logger.info(f"✅ Found {len(self.requirements)} REAL requirements")
         return self.requirements
     
+    def _map_files(self, parser: str, files: List[Path]) -> List:
+        """Apply the named parse method to files in order, using a process pool for large sets"""
+        if len(files) >= _PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(initializer=_init_worker, initargs=(str(self.repo_root),)) as executor:
+                    return list(executor.map(partial(_run_worker, parser), files, chunksize=16))
+            except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+                # e.g. module loaded under a name worker processes cannot import
+                logger.warning(f"⚠️ Parallel parsing unavailable ({e}), parsing inline")
+        return [getattr(self, parser)(file_path) for file_path in files]
+    
+    def _add_requirements(self, requirements: List[Requirement]):
+        """Record requirements parsed from one file"""
+        for requirement in requirements:
+            self.requirements[requirement.id] = requirement
+            logger.info(f"  ✓ {requirement.id}: {requirement.title[:50]}...")
+    
     def _extract_requirements_from_file(self, file_path: Path):
         """Extract requirements from a single file"""
+        self._add_requirements(self._parse_requirements_file(file_path))
+    
+    def _parse_requirements_file(self, file_path: Path) -> List[Requirement]:
+        """Parse the requirements defined in a single file (no side effects)"""
+        requirements = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            data = file_path.read_bytes()
+            
+            # Files without any requirement ID need neither decoding nor a line scan
+            if b'REQ-' not in data:
+                return requirements
+            
+            content = data.decode('utf-8')
+            if '\r' in content:  # same newline handling as text mode
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
                 
             # Determine category from file path
             if "functional" in str(file_path):
@@ -84,122 +213,131 @@ class RealRequirementsDiscovery:
             
             # Extract standard from filename
             standard = self._extract_standard_from_filename(file_path.name)
+            standard_key = standard.lower().replace('.', '').replace('-', '')
+            source_file = str(file_path.relative_to(self.repo_root))
             
             # Find requirement patterns: REQ-XXX-YYY-NNN:
-            req_pattern = r'^(REQ-[A-Z]+-[A-Z0-9]+-[0-9]+):\s*(.+?)$'
-            
-            lines = content.split('\n')
-            for line_num, line in enumerate(lines, 1):
-                match = re.match(req_pattern, line.strip())
-                if match:
-                    req_id = match.group(1)
-                    req_title = match.group(2).strip()
-                    
-                    # Extract description from following lines
-                    description = self._extract_requirement_description(lines, line_num)
-                    
-                    # Extract keywords from content
-                    keywords = self._extract_keywords(req_title + " " + description)
-                    
-                    requirement = Requirement(
-                        id=req_id,
-                        title=req_title,
-                        description=description,
-                        source_file=str(file_path.relative_to(self.repo_root)),
-                        category=category,
-                        standard=standard,
-                        keywords=keywords,
-                        line_number=line_num
-                    )
-                    
-                    self.requirements[req_id] = requirement
-                    logger.info(f"  ✓ {req_id}: {req_title[:50]}...")
+            line_num = 1
+            line_pos = 0
+            for match in _REQ_LINE.finditer(content):
+                line_num += content.count('\n', line_pos, match.start())
+                line_pos = match.start()
+                req_id = match.group(1)
+                req_title = match.group(2).strip()
+                
+                # Extract description from following lines
+                description = self._extract_requirement_description(
+                    self._following_lines(content, match.end()))
+                
+                # Extract keywords from content
+                keywords = self._extract_keywords(req_title + " " + description)
+                
+                requirement = Requirement(
+                    id=req_id,
+                    title=req_title,
+                    description=description,
+                    source_file=source_file,
+                    category=category,
+                    standard=standard,
+                    keywords=keywords,
+                    line_number=line_num,
+                    tech_mask=_technical_term_mask((req_title + " " + description).lower()),
+                    standard_key=standard_key
+                )
+                
+                requirements.append(requirement)
                     
         except Exception as e:
             logger.error(f"❌ Error processing {file_path}: {e}")
+            
+        return requirements
     
     def _extract_standard_from_filename(self, filename: str) -> str:
         """Extract standard name from filename"""
-        # Map filename patterns to standards
-        patterns = {
-            r'ieee-1722\.1': 'IEEE-1722.1',
-            r'ieee-1722(?!\.1)': 'IEEE-1722',
-            r'ieee-1588': 'IEEE-1588',
-            r'ieee-802\.1as': 'IEEE-802.1AS',
-            r'ieee-802\.1ab': 'IEEE-802.1AB',
-            r'ieee-802\.1ax': 'IEEE-802.1AX',
-            r'aes67': 'AES67',
-            r'aes70': 'AES70',
-            r'aes3': 'AES3',
-            r'aes5': 'AES5',
-            r'aes60': 'AES60',
-        }
-        
-        for pattern, standard in patterns.items():
-            if re.search(pattern, filename.lower()):
+        filename_lower = filename.lower()
+        for token, standard in _STD_TOKENS:
+            if token in filename_lower:
                 return standard
         return "UNKNOWN"
     
-    def _extract_requirement_description(self, lines: List[str], req_line: int) -> str:
-        """Extract requirement description from following lines"""
+    @staticmethod
+    def _following_lines(content: str, pos: int, count: int = 10) -> List[str]:
+        """Up to count lines following the line that contains pos"""
+        start = content.find('\n', pos)
+        if start < 0:
+            return []
+        end = start
+        for _ in range(count):
+            end = content.find('\n', end + 1)
+            if end < 0:
+                end = len(content)
+                break
+        return content[start + 1:end].split('\n')
+    
+    def _extract_requirement_description(self, lines: List[str]) -> str:
+        """Extract requirement description from the lines following a requirement"""
         description_lines = []
+        joined_length = -1  # len(' '.join(description_lines)), kept incrementally
+        append = description_lines.append
+        is_requirement = _REQ_PREFIX.match
         
         # Look for description in next few lines
-        for i in range(req_line, min(req_line + 10, len(lines))):
-            line = lines[i].strip()
+        for line in lines:
+            line = line.strip()
             
             # Stop at next requirement or empty line
-            if re.match(r'^REQ-[A-Z]+-[A-Z0-9]+-[0-9]+:', line):
+            if is_requirement(line):
                 break
             if not line:
                 continue
                 
             # Skip markdown headers and formatting
-            if line.startswith('#') or line.startswith('*') or line.startswith('-'):
+            if line.startswith(('#', '*', '-')):
                 continue
                 
-            description_lines.append(line)
+            append(line)
+            joined_length += len(line) + 1
             
             # Stop after reasonable description length
-            if len(' '.join(description_lines)) > 200:
+            if joined_length > 200:
                 break
                 
         return ' '.join(description_lines)[:500]  # Limit description length
     
-    def _extract_keywords(self, text: str) -> List[str]:
+    @staticmethod
+    def _build_keyword_automaton():
+        """Build an Aho-Corasick automaton over all domain keywords (None without pyahocorasick)"""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for domain, keywords in _DOMAIN_KEYWORDS.items():
+            for keyword in keywords:
+                automaton.add_word(keyword, (domain, keyword))
+        automaton.make_automaton()
+        return automaton
+    
+    def _extract_keywords(self, text: str) -> FrozenSet[str]:
         """Extract technical keywords from requirement text"""
-        # Technical domain keywords
-        domain_keywords = {
-            'timing': ['synchronization', 'timing', 'clock', 'sync', 'precision', 'accuracy', 'delay', 'jitter'],
-            'audio': ['audio', 'stream', 'channel', 'sampling', 'frequency', 'format', 'codec'],
-            'network': ['ethernet', 'packet', 'transmission', 'protocol', 'layer', 'frame'],
-            'control': ['control', 'command', 'response', 'management', 'configuration'],
-            'discovery': ['discovery', 'advertisement', 'announce', 'available', 'entity'],
-            'quality': ['quality', 'performance', 'latency', 'throughput', 'reliability'],
-            'security': ['security', 'authentication', 'encryption', 'authorization'],
-            'compatibility': ['compatibility', 'interoperability', 'compliance', 'standard']
-        }
-        
         text_lower = text.lower()
-        found_keywords = []
         
-        # Find domain keywords
-        for domain, keywords in domain_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    found_keywords.append(keyword)
+        # Find domain keywords: one pass over the text with the automaton,
+        # otherwise one substring scan per keyword
+        if self._keyword_automaton is not None:
+            found_keywords = [keyword for _, (_, keyword) in self._keyword_automaton.iter(text_lower)]
+        else:
+            found_keywords = [keyword for keyword in _ALL_KEYWORDS if keyword in text_lower]
         
         # Extract IEEE standard references
-        ieee_standards = re.findall(r'ieee[- ]?(\d+(?:\.\d+)?)', text_lower)
+        ieee_standards = _IEEE_RE.findall(text_lower)
         for std in ieee_standards:
             found_keywords.append(f'ieee-{std}')
         
         # Extract AES standard references  
-        aes_standards = re.findall(r'aes[- ]?(\d+)', text_lower)
+        aes_standards = _AES_RE.findall(text_lower)
         for std in aes_standards:
             found_keywords.append(f'aes{std}')
         
-        return list(set(found_keywords))
+        return frozenset(found_keywords)
     
     def discover_architecture_files(self) -> Dict[str, ArchitectureComponent]:
         """Discover architecture files that need requirement mapping"""
@@ -207,36 +345,48 @@ class RealRequirementsDiscovery:
         
         arch_dir = self.repo_root / "03-architecture"
         
-        for arch_file in arch_dir.rglob("*.md"):
-            if arch_file.name in ["README.md", "TEMPLATE.md"]:
-                continue
-                
+        arch_files = [
+            arch_file for arch_file in arch_dir.rglob("*.md")
+            if arch_file.name not in ["README.md", "TEMPLATE.md"]
+        ]
+        
+        for arch_file, component in zip(arch_files, self._map_files('_parse_architecture_file', arch_files)):
             logger.info(f"🏛️ Analyzing: {arch_file.relative_to(self.repo_root)}")
-            self._analyze_architecture_file(arch_file)
+            if component is not None:
+                self.architecture_files[str(arch_file)] = component
         
         logger.info(f"✅ Found {len(self.architecture_files)} architecture components")
         return self.architecture_files
     
-    def _analyze_architecture_file(self, file_path: Path):
+    def _analyze_architecture_file(self, file_path: Path) -> Optional[ArchitectureComponent]:
         """Analyze architecture file and extract current requirements"""
+        component = self._parse_architecture_file(file_path)
+        if component is not None:
+            self.architecture_files[str(file_path)] = component
+        return component
+    
+    def _parse_architecture_file(self, file_path: Path) -> Optional[ArchitectureComponent]:
+        """Parse a single architecture file (no side effects)"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
             # Parse YAML front matter
-            yaml_match = re.match(r'^---\n(.*?)\n---\n(.*)$', content, re.DOTALL)
+            yaml_match = _YAML_FM.match(content)
             if yaml_match:
                 yaml_content = yaml_match.group(1)
                 body_content = yaml_match.group(2)
                 
                 try:
-                    yaml_data = yaml.safe_load(yaml_content)
+                    yaml_data = yaml.load(yaml_content, Loader=SafeLoader)
                     current_requirements = yaml_data.get('requirements', [])
                     title = yaml_data.get('title', file_path.stem)
                 except:
+                    yaml_data = None
                     current_requirements = []
                     title = file_path.stem
             else:
+                yaml_data = {}
                 current_requirements = []
                 title = file_path.stem
                 body_content = content
@@ -244,18 +394,25 @@ class RealRequirementsDiscovery:
             # Extract keywords from content
             keywords = self._extract_keywords(title + " " + body_content)
             
+            content_preview = body_content[:1000]  # First 1000 chars
+            
             component = ArchitectureComponent(
                 file_path=str(file_path.relative_to(self.repo_root)),
                 title=title,
-                content=body_content[:1000],  # First 1000 chars
+                content=content_preview,
                 keywords=keywords,
-                current_requirements=current_requirements
+                current_requirements=current_requirements,
+                raw_yaml=yaml_data,
+                body=body_content,
+                tech_mask=_technical_term_mask(content_preview.lower()),
+                filename_key=file_path.name.lower().replace('-', '')
             )
             
-            self.architecture_files[str(file_path)] = component
+            return component
             
         except Exception as e:
             logger.error(f"❌ Error analyzing {file_path}: {e}")
+            return None
     
     def create_semantic_mapping(self) -> Dict[str, List[str]]:
         """Create semantic mapping between architecture files and requirements"""
@@ -263,22 +420,30 @@ class RealRequirementsDiscovery:
         
         mappings = {}
         
+        # Scoring stays in this process: with the candidate index it is cheap, and
+        # a process pool would have to ship the requirement features to every worker
+        requirements = list(self.requirements.values())
+        self._encode_scoring_features(requirements, self.architecture_files.values())
+        candidate_index = self._build_candidate_index(requirements)
+        
         for arch_file, arch_component in self.architecture_files.items():
             mapped_requirements = []
             
-            # Score requirements based on keyword overlap
+            # Score requirements based on keyword overlap. Only requirements sharing
+            # at least one scoring feature can score above zero; visit them in
+            # discovery order so ties rank as before.
             requirement_scores = {}
             
-            for req_id, requirement in self.requirements.items():
+            for req_index in sorted(self._find_candidates(arch_component, candidate_index)):
+                requirement = requirements[req_index]
                 score = self._calculate_semantic_score(arch_component, requirement)
                 if score > 0:
-                    requirement_scores[req_id] = score
+                    requirement_scores[requirement.id] = score
             
-            # Select top matching requirements
-            sorted_reqs = sorted(requirement_scores.items(), key=lambda x: x[1], reverse=True)
+            # Select the top 5 most relevant requirements (ties keep discovery order)
+            top_reqs = heapq.nlargest(5, requirement_scores.items(), key=lambda x: x[1])
             
-            # Take top 5 most relevant requirements
-            for req_id, score in sorted_reqs[:5]:
+            for req_id, score in top_reqs:
                 mapped_requirements.append(req_id)
                 logger.info(f"  📎 {arch_component.title} ↔ {req_id} (score: {score:.2f})")
             
@@ -286,46 +451,72 @@ class RealRequirementsDiscovery:
         
         return mappings
     
+    @staticmethod
+    def _encode_scoring_features(requirements: List[Requirement], components) -> None:
+        """Encode keyword sets as bitmasks and title words as int ids for scoring"""
+        keyword_vocab: Dict[str, int] = {}
+        title_vocab: Dict[str, int] = {}
+        for item in (*requirements, *components):
+            mask = 0
+            for keyword in item.keywords:
+                mask |= 1 << keyword_vocab.setdefault(keyword, len(keyword_vocab))
+            item.keyword_mask = mask
+            item.title_tokens = frozenset(
+                title_vocab.setdefault(word, len(title_vocab)) for word in item.title.lower().split()
+            )
+    
+    def _build_candidate_index(self, requirements: List[Requirement]) -> Dict[str, Dict[str, List[int]]]:
+        """Inverted indexes from each scoring feature to the requirements (by position) having it"""
+        index = {'keywords': {}, 'title_words': {}, 'terms': {}, 'standards': {}}
+        
+        for req_index, requirement in enumerate(requirements):
+            features = {
+                'keywords': requirement.keywords,
+                'title_words': requirement.title_tokens,
+                'terms': _mask_bits(requirement.tech_mask),
+                'standards': {requirement.standard_key},
+            }
+            for kind, values in features.items():
+                postings = index[kind]
+                for value in values:
+                    postings.setdefault(value, []).append(req_index)
+        
+        return index
+    
+    def _find_candidates(self, arch_component: ArchitectureComponent,
+                         index: Dict[str, Dict[str, List[int]]]) -> Set[int]:
+        """Positions of requirements that share at least one scoring feature with the component"""
+        candidates: Set[int] = set()
+        for keyword in arch_component.keywords:
+            candidates.update(index['keywords'].get(keyword, ()))
+        for token in arch_component.title_tokens:
+            candidates.update(index['title_words'].get(token, ()))
+        for term_bit in _mask_bits(arch_component.tech_mask):
+            candidates.update(index['terms'].get(term_bit, ()))
+        for standard, postings in index['standards'].items():
+            if standard in arch_component.filename_key:
+                candidates.update(postings)
+        
+        return candidates
+    
     def _calculate_semantic_score(self, arch_component: ArchitectureComponent, requirement: Requirement) -> float:
         """Calculate semantic similarity score between architecture and requirement"""
         score = 0.0
         
         # Keyword overlap scoring
-        arch_keywords = set(arch_component.keywords)
-        req_keywords = set(requirement.keywords)
-        
-        overlap = arch_keywords.intersection(req_keywords)
-        if overlap:
-            score += len(overlap) * 2.0
+        overlap = (arch_component.keyword_mask & requirement.keyword_mask).bit_count()
+        score += overlap * 2.0
         
         # Standard matching bonus
-        arch_filename = Path(arch_component.file_path).name.lower()
-        req_standard = requirement.standard.lower().replace('.', '')
-        
-        if req_standard.replace('-', '') in arch_filename.replace('-', ''):
+        if requirement.standard_key in arch_component.filename_key:
             score += 10.0
         
-        # Title matching
-        arch_title = arch_component.title.lower()
-        req_title = requirement.title.lower()
-        
-        # Look for common technical terms
-        title_words = set(arch_title.split()) & set(req_title.split())
+        # Title matching: common title words, by token id
+        title_words = arch_component.title_tokens & requirement.title_tokens
         score += len(title_words) * 1.5
         
-        # Content analysis
-        arch_content = arch_component.content.lower()
-        req_content = (requirement.title + " " + requirement.description).lower()
-        
-        # Check for shared technical terms
-        shared_terms = 0
-        technical_terms = ['protocol', 'message', 'packet', 'stream', 'entity', 'descriptor', 
-                          'command', 'response', 'synchronization', 'timing', 'audio']
-        
-        for term in technical_terms:
-            if term in arch_content and term in req_content:
-                shared_terms += 1
-        
+        # Content analysis: shared technical terms, from the precomputed term masks
+        shared_terms = (arch_component.tech_mask & requirement.tech_mask).bit_count()
         score += shared_terms * 0.5
         
         return score
@@ -342,7 +533,8 @@ class RealRequirementsDiscovery:
             "total_architecture_files": len(self.architecture_files),
             "requirements_by_standard": {},
             "mappings": mappings,
-            "detailed_requirements": {req_id: asdict(req) for req_id, req in self.requirements.items()},
+            # Requirement objects are converted one at a time when the report is written
+            "detailed_requirements": self.requirements,
             "unmapped_requirements": [],
             "architecture_coverage": {}
         }
@@ -383,36 +575,67 @@ class RealRequirementsDiscovery:
             try:
                 file_path = Path(arch_file)
                 
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                # Reuse the front matter parsed during discovery
+                component = self.architecture_files.get(arch_file) or self._analyze_architecture_file(file_path)
+                if component is None:
+                    continue
+                if component.raw_yaml is None:
+                    raise ValueError("unparseable YAML front matter")
                 
-                # Parse existing YAML front matter
-                yaml_match = re.match(r'^---\n(.*?)\n---\n(.*)$', content, re.DOTALL)
-                if yaml_match:
-                    yaml_content = yaml_match.group(1)
-                    body_content = yaml_match.group(2)
-                    
-                    yaml_data = yaml.safe_load(yaml_content)
-                else:
-                    # Create new YAML front matter
-                    yaml_data = {}
-                    body_content = content
+                # Nothing to write when the mapping is already recorded
+                if component.raw_yaml.get('requirements') == req_list:
+                    continue
+                
+                # Files without front matter get a new one
+                yaml_data = dict(component.raw_yaml)
+                body_content = component.body
                 
                 # Update requirements field
                 yaml_data['requirements'] = req_list
                 
                 # Write updated file
-                new_yaml = yaml.dump(yaml_data, default_flow_style=False, sort_keys=True)
+                new_yaml = yaml.dump(yaml_data, Dumper=SafeDumper, default_flow_style=False, sort_keys=True)
                 new_content = f"---\n{new_yaml}---\n{body_content}"
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+                file_path.write_text(new_content, encoding='utf-8')
                 
                 logger.info(f"✅ Updated {file_path.name} with {len(req_list)} requirements")
                 
             except Exception as e:
                 logger.error(f"❌ Error updating {arch_file}: {e}")
 
+def _report_record(requirement: Requirement) -> Dict:
+    """Requirement as a report dict, without derived scoring fields"""
+    record = {f.name: getattr(requirement, f.name) for f in fields(requirement)
+              if not f.metadata.get('derived')}
+    record['keywords'] = sorted(requirement.keywords)
+    return record
+
+def _report_default(obj):
+    """JSON default hook: serialise Requirement objects as report records"""
+    if isinstance(obj, Requirement):
+        return _report_record(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _write_report(report: Dict, path: Path):
+    """Write the report as indented UTF-8 JSON"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(report, default=_report_default,
+                                      option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS))
+    else:
+        with open(path, "w", encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, default=_report_default)
+
+# Process pool workers: each process parses with its own discovery instance
+_worker_discovery: Optional[RealRequirementsDiscovery] = None
+
+def _init_worker(repo_root: str):
+    global _worker_discovery
+    _worker_discovery = RealRequirementsDiscovery(repo_root)
+
+def _run_worker(parser: str, file_path: Path):
+    return getattr(_worker_discovery, parser)(file_path)
+
 def main():
     """Main execution function"""
     repo_root = "."
@@ -435,8 +658,7 @@ def main():
     report = discovery.generate_traceability_report()
     
     # Save report
-    with open("Requirements_Traceability_Report.json", "w", encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    _write_report(report, Path("Requirements_Traceability_Report.json"))
     
     # Step 5: Update architecture files
     discovery.update_architecture_yaml_headers(mappings)
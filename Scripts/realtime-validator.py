@@ -15,72 +15,214 @@ PREVENTS ERRORS DURING TYPING - NOT AFTER SAVING!
 
 import os
 import sys
+import glob
 import json
 import yaml
 import re
+import pickle
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Any
 import tempfile
 import subprocess
 import time
+import signal
 import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict, defaultdict
+from functools import cached_property
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+try:
+    import ahocorasick  # pyahocorasick: optional, scores all reference suggestions in one pass
+except ImportError:
+    ahocorasick = None
+
+# Base enforcer lives next to this script
+sys.path.append(str(Path(__file__).resolve().parent))
+try:
+    from first_attempt_correct import FirstAttemptCorrectEnforcer
+except ImportError as e:  # reported when an enforcer is constructed
+    FirstAttemptCorrectEnforcer = None
+    _BASE_ENFORCER_IMPORT_ERROR = e
+
+# Specification IDs referenced in content. Kept as a plain alternation: re scans
+# ahead for its first characters (R/A/D), which a leading \b would disable.
+_ID_RE = re.compile(r'(REQ-[A-Z0-9-]+|ARCH-[A-Z0-9-]+|DES-[A-Z0-9-]+|ADR-[0-9]+)')
+
+# Technical terms that raise confidence in a standard suggestion
+_TECHNICAL_TERMS = {
+    'IEEE-1722-2016': ['avtp', 'transport', 'streaming', 'audio', 'video'],
+    'IEEE-1722.1-2021': ['avdecc', 'discovery', 'control', 'entity'],
+    'IEEE-802.1AS-2021': ['gptp', 'timing', 'synchronization', 'clock'],
+    'AES67-2018': ['audio over ip', 'interoperability', 'streaming']
+}
+
+# Example values for YAML field suggestions: by field name, else by schema type
+_FIELD_EXAMPLES = {
+    'specType': 'requirements',
+    'phase': '02-requirements',
+    'version': '1.0.0',
+    'status': 'draft',
+    'date': '2025-10-12',
+    'authoritativeReferences': [{'id': 'IEEE_1722_2016', 'title': 'IEEE 1722-2016 - AVTP', 'url': 'mcp://markitdown/standards/...'}],
+}
+_TYPE_EXAMPLES = {'array': [], 'object': {}, 'boolean': False, 'integer': 0}
+
+# Static part of the generated VS Code settings (schema mappings are added per enforcer)
+_VSCODE_SETTINGS = {
+    "yaml.customTags": [],
+    "files.associations": {
+        "02-requirements/**/*.md": "yaml-frontmatter-markdown",
+        "03-architecture/**/*.md": "yaml-frontmatter-markdown", 
+        "04-design/**/*.md": "yaml-frontmatter-markdown"
+    },
+    "editor.quickSuggestions": {
+        "other": True,
+        "comments": False,
+        "strings": True
+    }
+}
+
+def _extract_front_matter(content: str) -> Optional[str]:
+    """Return the YAML front matter between the leading '---' lines, or None."""
+    if not content.startswith('---\n'):
+        return None
+    end = content.find('\n---', 4)
+    if end < 0:
+        return None
+    return content[4:end]
+
+# Characters read at a time when looking for the end of a file's front matter
+_FRONT_MATTER_CHUNK = 65536
+
+def _read_front_matter(file_path: Path) -> Optional[str]:
+    """Like _extract_front_matter on the file's text, but reading only as far as the front matter."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = f.read(_FRONT_MATTER_CHUNK)
+        if not text.startswith('---\n'):
+            return None
+        
+        search_from = 4
+        while True:
+            end = text.find('\n---', search_from)
+            if end >= 0:
+                return text[4:end]
+            chunk = f.read(_FRONT_MATTER_CHUNK)
+            if not chunk:
+                return None
+            search_from = max(4, len(text) - 3)  # the delimiter may straddle chunks
+            text += chunk
+
 class RealTimeValidator(FileSystemEventHandler):
     """Real-time file validation as content changes."""
     
+    # Quiet period after the last modify event before a file is validated;
+    # editors often emit several events per save
+    DEBOUNCE_SECONDS = 0.25
+    # Front matter blocks whose schema issues are remembered
+    VALIDATION_CACHE_SIZE = 512
+    # Files whose parsed front matter is remembered
+    YAML_CACHE_SIZE = 512
+    
     def __init__(self, enforcer):
         self.enforcer = enforcer
-        self.validation_cache = {}
-        self.last_validation = {}
+        self.validation_cache: 'OrderedDict[Tuple[str, str], List[str]]' = OrderedDict()
+        self._yaml_cache: 'OrderedDict[str, Tuple[Tuple[int, int], Tuple[Optional[str], Any]]]' = OrderedDict()
+        self._timers: Dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
         
     def on_modified(self, event):
         """Handle file modification events."""
         if not event.is_directory and event.src_path.endswith('.md'):
-            self.validate_file_realtime(Path(event.src_path))
+            self._schedule_validation(event.src_path)
+    
+    def _schedule_validation(self, src_path: str):
+        """(Re)start the debounce timer for a file; only the last event of a burst validates."""
+        with self._lock:
+            pending = self._timers.get(src_path)
+            if pending:
+                pending.cancel()
+            timer = threading.Timer(self.DEBOUNCE_SECONDS, self._run_scheduled_validation, args=(src_path,))
+            timer.daemon = True
+            self._timers[src_path] = timer
+            timer.start()
+    
+    def _run_scheduled_validation(self, src_path: str):
+        """Timer callback: forget the timer, then validate."""
+        with self._lock:
+            if self._timers.get(src_path) is threading.current_thread():
+                del self._timers[src_path]
+        self.validate_file_realtime(Path(src_path))
+    
+    def schema_issues(self, yaml_data: Dict, spec_type: str, yaml_content: str) -> List[str]:
+        """Schema issues for parsed front matter, memoized on its exact YAML text (LRU)."""
+        key = (spec_type, yaml_content)
+        with self._lock:
+            issues = self.validation_cache.get(key)
+            if issues is not None:
+                self.validation_cache.move_to_end(key)
+                return issues
+        
+        issues = self.enforcer.validate_yaml_realtime(yaml_data, spec_type)
+        
+        with self._lock:
+            self.validation_cache[key] = issues
+            if len(self.validation_cache) > self.VALIDATION_CACHE_SIZE:
+                self.validation_cache.popitem(last=False)
+        return issues
+    
+    def _load_front_matter(self, file_path: Path) -> Tuple[Optional[str], Any]:
+        """Front matter text and parsed YAML of a file, reused while its mtime and size are unchanged (LRU)."""
+        st = file_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = str(file_path)
+        with self._lock:
+            cached = self._yaml_cache.get(key)
+            if cached and cached[0] == stamp:
+                self._yaml_cache.move_to_end(key)
+                return cached[1]
+        
+        yaml_content = _read_front_matter(file_path)
+        yaml_data = yaml.load(yaml_content, Loader=SafeLoader) if yaml_content is not None else None
+        
+        with self._lock:
+            self._yaml_cache[key] = (stamp, (yaml_content, yaml_data))
+            self._yaml_cache.move_to_end(key)
+            if len(self._yaml_cache) > self.YAML_CACHE_SIZE:
+                self._yaml_cache.popitem(last=False)
+        return yaml_content, yaml_data
     
     def validate_file_realtime(self, file_path: Path):
         """Validate file in real-time with immediate feedback."""
         try:
-            # Avoid validation spam - only validate if file changed significantly
-            current_time = time.time()
-            last_check = self.last_validation.get(str(file_path), 0)
-            
-            if current_time - last_check < 1.0:  # Minimum 1 second between validations
+            try:
+                yaml_content, yaml_data = self._load_front_matter(file_path)
+            except yaml.YAMLError as e:
+                print(f"🔴 YAML Syntax Error in {file_path.name}: {e}")
                 return
-                
-            self.last_validation[str(file_path)] = current_time
-            
-            content = file_path.read_text(encoding='utf-8')
             
-            # Extract YAML front matter
-            yaml_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-            if not yaml_match:
+            if yaml_content is None or not yaml_data:
                 return  # No YAML front matter
             
-            yaml_content = yaml_match.group(1)
-            
-            try:
-                yaml_data = yaml.safe_load(yaml_content)
-                if not yaml_data:
-                    return
+            # Real-time validation
+            spec_type = yaml_data.get('specType')
+            if spec_type in self.enforcer.schemas:
+                issues = self.schema_issues(yaml_data, spec_type, yaml_content)
                 
-                # Real-time validation
-                spec_type = yaml_data.get('specType')
-                if spec_type in self.enforcer.schemas:
-                    issues = self.enforcer.validate_yaml_realtime(yaml_data, spec_type)
-                    
-                    if issues:
-                        # Show immediate feedback (could integrate with VS Code)
-                        print(f"\n⚠️  REAL-TIME VALIDATION: {file_path.name}")
-                        for issue in issues:
-                            print(f"   🔴 {issue}")
-                    else:
-                        print(f"✅ Real-time validation: {file_path.name} - VALID")
-                        
-            except yaml.YAMLError as e:
-                print(f"🔴 YAML Syntax Error in {file_path.name}: {e}")
+                if issues:
+                    # Show immediate feedback (could integrate with VS Code)
+                    print(f"\n⚠️  REAL-TIME VALIDATION: {file_path.name}")
+                    for issue in issues:
+                        print(f"   🔴 {issue}")
+                else:
+                    print(f"✅ Real-time validation: {file_path.name} - VALID")
                 
         except Exception as e:
             print(f"⚠️  Validation error for {file_path}: {e}")
@@ -90,110 +232,165 @@ class YAMLAutoCompletion:
     
     def __init__(self, enforcer):
         self.enforcer = enforcer
-        
-    def get_field_suggestions(self, spec_type: str, current_fields: List[str]) -> Dict[str, Any]:
-        """Get suggestions for next YAML field based on schema."""
-        if spec_type not in self.enforcer.schemas:
-            return {}
-        
-        schema = self.enforcer.schemas[spec_type]
+        # Suggestion for every schema field, required fields first, per spec type
+        self._templates: Dict[str, Dict[str, Dict[str, Any]]] = {
+            spec_type: self._build_template(schema) for spec_type, schema in enforcer.schemas.items()
+        }
+    
+    def _build_template(self, schema: Dict) -> Dict[str, Dict[str, Any]]:
+        """Build the suggestions for all fields of a schema."""
         properties = schema.get('properties', {})
         required = schema.get('required', [])
         
-        suggestions = {}
+        template = {}
         
-        # Suggest missing required fields first
         for field in required:
-            if field not in current_fields:
-                field_schema = properties.get(field, {})
-                suggestions[field] = {
-                    'priority': 'required',
-                    'type': field_schema.get('type', 'string'),
-                    'description': field_schema.get('description', ''),
-                    'example': self._get_field_example(field, field_schema)
-                }
-        
-        # Suggest optional fields
+            field_schema = properties.get(field, {})
+            template[field] = self._field_suggestion('required', field, field_schema)
+        
         for field, field_schema in properties.items():
-            if field not in current_fields and field not in required:
-                suggestions[field] = {
-                    'priority': 'optional',
-                    'type': field_schema.get('type', 'string'),
-                    'description': field_schema.get('description', ''),
-                    'example': self._get_field_example(field, field_schema)
-                }
+            if field not in required:
+                template[field] = self._field_suggestion('optional', field, field_schema)
         
-        return suggestions
+        return template
+    
+    def _field_suggestion(self, priority: str, field: str, field_schema: Dict) -> Dict[str, Any]:
+        """Suggestion entry for one schema field."""
+        return {
+            'priority': priority,
+            'type': field_schema.get('type', 'string'),
+            'description': field_schema.get('description', ''),
+            'example': self._get_field_example(field, field_schema)
+        }
+        
+    def get_field_suggestions(self, spec_type: str, current_fields: List[str]) -> Dict[str, Any]:
+        """Get suggestions for next YAML field based on schema.
+        
+        Missing required fields come first, then missing optional ones. The
+        suggestion dicts are shared between calls and must not be modified.
+        """
+        template = self._templates.get(spec_type)
+        if template is None:
+            return {}
+        
+        present = set(current_fields)
+        return {field: suggestion for field, suggestion in template.items() if field not in present}
     
     def _get_field_example(self, field_name: str, field_schema: Dict) -> Any:
         """Generate example value for field."""
-        field_type = field_schema.get('type', 'string')
-        
-        if field_name == 'specType':
-            return 'requirements'
-        elif field_name == 'phase':
-            return '02-requirements'
-        elif field_name == 'version':
-            return '1.0.0'
-        elif field_name == 'status':
-            return 'draft'
-        elif field_name == 'date':
-            return '2025-10-12'
-        elif field_name == 'authoritativeReferences':
-            return [{'id': 'IEEE_1722_2016', 'title': 'IEEE 1722-2016 - AVTP', 'url': 'mcp://markitdown/standards/...'}]
-        elif field_type == 'array':
-            return []
-        elif field_type == 'object':
-            return {}
-        elif field_type == 'boolean':
-            return False
-        elif field_type == 'integer':
-            return 0
-        else:
-            return ''
+        if field_name in _FIELD_EXAMPLES:
+            return _FIELD_EXAMPLES[field_name]
+        return _TYPE_EXAMPLES.get(field_schema.get('type', 'string'), '')
 
 class LiveIDConflictDetector:
     """Detects ID conflicts in real-time as user types."""
     
+    # Seconds before the registry snapshot is taken again
+    REGISTRY_REFRESH_SECONDS = 30.0
+    
     def __init__(self, enforcer):
         self.enforcer = enforcer
+        self.refresh_registry()
+    
+    def refresh_registry(self):
+        """Snapshot the ID registry as frozensets, by ID prefix, for O(1) lookups."""
+        registry = self.enforcer.id_registry
+        self._registries: Dict[str, Tuple[FrozenSet[str], str]] = {
+            'REQ': (frozenset(registry.requirements), 'requirement'),
+            'ARCH': (frozenset(registry.architecture), 'architecture'),
+            'DES': (frozenset(registry.design), 'design'),
+            'ADR': (frozenset(registry.adrs), 'ADR'),
+        }
+        self._registry_snapshot_time = time.monotonic()
         
     def check_id_conflicts(self, content: str) -> List[str]:
         """Check for ID conflicts in content."""
-        conflicts = []
-        
-        # Extract all IDs from content
-        all_ids = re.findall(r'(REQ-[A-Z0-9-]+|ARCH-[A-Z0-9-]+|DES-[A-Z0-9-]+|ADR-[0-9]+)', content)
-        
-        # Check against existing registry
-        for id_val in all_ids:
-            if id_val.startswith('REQ-') and id_val in self.enforcer.id_registry.requirements:
-                conflicts.append(f"Duplicate requirement ID: {id_val}")
-            elif id_val.startswith('ARCH-') and id_val in self.enforcer.id_registry.architecture:
-                conflicts.append(f"Duplicate architecture ID: {id_val}")
-            elif id_val.startswith('DES-') and id_val in self.enforcer.id_registry.design:
-                conflicts.append(f"Duplicate design ID: {id_val}")
-            elif id_val.startswith('ADR-') and id_val in self.enforcer.id_registry.adrs:
-                conflicts.append(f"Duplicate ADR ID: {id_val}")
-        
-        # Check for duplicates within the same content
-        id_counts = {}
-        for id_val in all_ids:
-            id_counts[id_val] = id_counts.get(id_val, 0) + 1
-            if id_counts[id_val] > 1:
-                conflicts.append(f"Duplicate ID in same document: {id_val}")
-        
-        return conflicts
+        if time.monotonic() - self._registry_snapshot_time > self.REGISTRY_REFRESH_SECONDS:
+            self.refresh_registry()
+        registries = self._registries
+        
+        # Single pass over the IDs in content: registry conflicts are reported for
+        # every occurrence, duplicates within the content for every repeat
+        registry_conflicts = []
+        duplicates = []
+        seen: Dict[str, Optional[str]] = {}
+        
+        for id_val in _ID_RE.findall(content):
+            if id_val in seen:
+                conflict = seen[id_val]
+                duplicates.append(f"Duplicate ID in same document: {id_val}")
+            else:
+                ids, kind = registries[id_val.partition('-')[0]]
+                conflict = f"Duplicate {kind} ID: {id_val}" if id_val in ids else None
+                seen[id_val] = conflict
+            if conflict:
+                registry_conflicts.append(conflict)
+        
+        return registry_conflicts + duplicates
 
 class AuthoritativeReferenceSuggester:
     """Suggests authoritative references based on content analysis."""
     
+    # Documents whose detected standards are remembered
+    DETECT_CACHE_SIZE = 128
+    
     def __init__(self, enforcer):
         self.enforcer = enforcer
+        self._detect_cache: 'OrderedDict[Tuple[str, Optional[str]], List[str]]' = OrderedDict()
+        self._std_patterns: Dict[str, re.Pattern] = {
+            standard: self._compile_standard(standard) for standard in enforcer.authoritative_refs
+        }
+        self._automaton = self._build_automaton()
+    
+    def _build_automaton(self):
+        """Aho-Corasick automaton over all standard names and technical terms (None without pyahocorasick)."""
+        if ahocorasick is None:
+            return None
+        
+        # Pattern -> [(kind, standard)]; a term may belong to several standards
+        owners: Dict[str, List[Tuple[str, str]]] = {}
+        for standard in self.enforcer.authoritative_refs:
+            owners.setdefault(standard.lower(), []).append(('standard', standard))
+            for term in _TECHNICAL_TERMS.get(standard, []):
+                owners.setdefault(term, []).append(('term', standard))
+        
+        automaton = ahocorasick.Automaton()
+        for pattern, pattern_owners in owners.items():
+            automaton.add_word(pattern, (pattern, pattern_owners))
+        automaton.make_automaton()
+        return automaton
+    
+    def _score_all(self, content_lower: str) -> Dict[str, float]:
+        """Confidence for every known standard from a single automaton pass over the content."""
+        mentions = defaultdict(int)
+        last_mention_end: Dict[str, int] = {}
+        terms = defaultdict(set)
+        
+        for end, (pattern, pattern_owners) in self._automaton.iter(content_lower):
+            for kind, standard in pattern_owners:
+                if kind == 'term':
+                    terms[standard].add(pattern)
+                # Count non-overlapping mentions, like findall does
+                elif end - len(pattern) >= last_mention_end.get(standard, -1):
+                    mentions[standard] += 1
+                    last_mention_end[standard] = end
+        
+        return {
+            standard: min(1.0, (mentions[standard] * 0.3 + len(terms[standard]) * 0.1))
+            for standard in self.enforcer.authoritative_refs
+        }
+    
+    @staticmethod
+    def _compile_standard(standard: str) -> re.Pattern:
+        """Pattern matching mentions of a standard in lower-cased content."""
+        return re.compile(standard.lower().replace('.', r'\.'))
         
     def suggest_references(self, content: str, file_path: Path = None) -> List[Dict[str, str]]:
         """Suggest authoritative references based on content."""
-        detected_standards = self.enforcer.detect_content_standards(content, file_path)
+        detected_standards = self._detect_standards(content, file_path)
+        
+        content_lower = content.lower()
+        confidences = self._score_all(content_lower) if self._automaton is not None else None
         
         suggestions = []
         for standard in detected_standards:
@@ -204,29 +401,38 @@ class AuthoritativeReferenceSuggester:
                     'title': ref.title,
                     'url': ref.url,
                     'section': ref.section or 'General',
-                    'confidence': self._calculate_confidence(standard, content)
+                    'confidence': (confidences[standard] if confidences is not None
+                                   else self._calculate_confidence(standard, content_lower))
                 })
         
         # Sort by confidence
         suggestions.sort(key=lambda x: x['confidence'], reverse=True)
         return suggestions
     
-    def _calculate_confidence(self, standard: str, content: str) -> float:
-        """Calculate confidence score for reference suggestion."""
-        content_lower = content.lower()
-        
+    def _detect_standards(self, content: str, file_path: Optional[Path]) -> List[str]:
+        """detect_content_standards, memoized on the exact content and path (LRU)."""
+        key = (content, str(file_path) if file_path is not None else None)
+        detected = self._detect_cache.get(key)
+        if detected is not None:
+            self._detect_cache.move_to_end(key)
+            return detected
+        
+        detected = self.enforcer.detect_content_standards(content, file_path)
+        self._detect_cache[key] = detected
+        if len(self._detect_cache) > self.DETECT_CACHE_SIZE:
+            self._detect_cache.popitem(last=False)
+        return detected
+    
+    def _calculate_confidence(self, standard: str, content_lower: str) -> float:
+        """Calculate confidence score for reference suggestion from lower-cased content."""
         # Count mentions of standard
-        standard_mentions = len(re.findall(standard.lower().replace('.', r'\.'), content_lower))
+        pattern = self._std_patterns.get(standard)
+        if pattern is None:
+            pattern = self._std_patterns[standard] = self._compile_standard(standard)
+        standard_mentions = len(pattern.findall(content_lower))
         
         # Count technical terms
-        technical_terms = {
-            'IEEE-1722-2016': ['avtp', 'transport', 'streaming', 'audio', 'video'],
-            'IEEE-1722.1-2021': ['avdecc', 'discovery', 'control', 'entity'],
-            'IEEE-802.1AS-2021': ['gptp', 'timing', 'synchronization', 'clock'],
-            'AES67-2018': ['audio over ip', 'interoperability', 'streaming']
-        }
-        
-        terms = technical_terms.get(standard, [])
+        terms = _TECHNICAL_TERMS.get(standard, [])
         term_matches = sum(1 for term in terms if term in content_lower)
         
         # Calculate confidence (0.0 to 1.0)
@@ -236,22 +442,44 @@ class AuthoritativeReferenceSuggester:
 class FirstAttemptCorrectEnforcerExtended:
     """Extended enforcer with real-time capabilities."""
     
+    # Base enforcers (parsed schemas, ID registry) shared by all instances per repository
+    _base_cache: Dict[Path, Any] = {}
+    
     def __init__(self, repo_root: Path):
-        # Import the base enforcer
-        sys.path.append(str(repo_root / 'Scripts'))
-        from first_attempt_correct import FirstAttemptCorrectEnforcer
+        if FirstAttemptCorrectEnforcer is None:
+            raise _BASE_ENFORCER_IMPORT_ERROR
         
-        self.base_enforcer = FirstAttemptCorrectEnforcer(repo_root)
-        self.repo_root = repo_root
+        cache_key = Path(repo_root).resolve()
+        if cache_key not in self._base_cache:
+            self._base_cache[cache_key] = FirstAttemptCorrectEnforcer(repo_root)
         
-        # Real-time components
-        self.validator = RealTimeValidator(self.base_enforcer)
-        self.autocomplete = YAMLAutoCompletion(self.base_enforcer)
-        self.id_detector = LiveIDConflictDetector(self.base_enforcer)
-        self.ref_suggester = AuthoritativeReferenceSuggester(self.base_enforcer)
+        self.base_enforcer = self._base_cache[cache_key]
+        self.repo_root = repo_root
         
-        # File watcher
-        self.observer = Observer()
+        # (spec types, settings JSON) of the last generated VS Code configuration
+        self._vscode_config: Optional[Tuple[Tuple[str, ...], str]] = None
+    
+    # Real-time components, created on first use so each command only builds what it needs
+    
+    @cached_property
+    def validator(self) -> RealTimeValidator:
+        return RealTimeValidator(self.base_enforcer)
+    
+    @cached_property
+    def autocomplete(self) -> YAMLAutoCompletion:
+        return YAMLAutoCompletion(self.base_enforcer)
+    
+    @cached_property
+    def id_detector(self) -> LiveIDConflictDetector:
+        return LiveIDConflictDetector(self.base_enforcer)
+    
+    @cached_property
+    def ref_suggester(self) -> AuthoritativeReferenceSuggester:
+        return AuthoritativeReferenceSuggester(self.base_enforcer)
+    
+    @cached_property
+    def observer(self) -> Observer:
+        return Observer()
         
     def start_realtime_monitoring(self, watch_paths: List[Path] = None):
         """Start real-time monitoring of specification files."""
@@ -272,13 +500,23 @@ class FirstAttemptCorrectEnforcerExtended:
         self.observer.start()
         print(f"✅ Real-time monitoring active!")
         
+        # Sleep until SIGINT/SIGTERM. Windows cannot interrupt a blocking wait,
+        # so the main thread still wakes up once a second there.
+        self._stop = threading.Event()
+        previous_handlers = {
+            sig: signal.signal(sig, lambda *_: self._stop.set())
+            for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+        wake_interval = 1.0 if os.name == 'nt' else None
         try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            self.observer.stop()
-            print(f"\n🛑 Real-time monitoring stopped")
-        
+            while not self._stop.wait(wake_interval):
+                pass
+        finally:
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+        
+        self.observer.stop()
+        print(f"\n🛑 Real-time monitoring stopped")
         self.observer.join()
     
     def validate_content_live(self, content: str, spec_type: str = None, 
@@ -295,17 +533,16 @@ class FirstAttemptCorrectEnforcerExtended:
         
         try:
             # Extract and validate YAML
-            yaml_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-            if yaml_match:
-                yaml_content = yaml_match.group(1)
-                yaml_data = yaml.safe_load(yaml_content)
+            yaml_content = _extract_front_matter(content)
+            if yaml_content is not None:
+                yaml_data = yaml.load(yaml_content, Loader=SafeLoader)
                 
                 if yaml_data:
                     spec_type = yaml_data.get('specType', spec_type)
                     
                     # Schema validation
                     if spec_type in self.base_enforcer.schemas:
-                        schema_issues = self.base_enforcer.validate_yaml_realtime(yaml_data, spec_type)
+                        schema_issues = self.validator.schema_issues(yaml_data, spec_type, yaml_content)
                         if schema_issues:
                             results['schema_valid'] = False
                             results['issues'].extend(schema_issues)
@@ -331,28 +568,77 @@ class FirstAttemptCorrectEnforcerExtended:
     
     def create_vscode_integration(self) -> str:
         """Generate VS Code integration configuration."""
-        
-        config = {
-            "yaml.schemas": {},
-            "yaml.customTags": [],
-            "files.associations": {
-                "02-requirements/**/*.md": "yaml-frontmatter-markdown",
-                "03-architecture/**/*.md": "yaml-frontmatter-markdown", 
-                "04-design/**/*.md": "yaml-frontmatter-markdown"
-            },
-            "editor.quickSuggestions": {
-                "other": True,
-                "comments": False,
-                "strings": True
+        # Only the schema mappings depend on the enforcer; rebuild when its schema set changes
+        spec_types = tuple(self.base_enforcer.schemas)
+        if self._vscode_config is None or self._vscode_config[0] != spec_types:
+            schemas = {
+                f"./spec-kit-templates/schemas/{spec_type}-spec.schema.json": [f"**/*{spec_type}*.md"]
+                for spec_type in spec_types
             }
-        }
-        
-        # Add schema mappings
-        for spec_type in self.base_enforcer.schemas:
-            schema_path = f"./spec-kit-templates/schemas/{spec_type}-spec.schema.json"
-            config["yaml.schemas"][schema_path] = [f"**/*{spec_type}*.md"]
+            config = {"yaml.schemas": schemas, **_VSCODE_SETTINGS}
+            self._vscode_config = (spec_types, json.dumps(config, indent=2))
         
-        return json.dumps(config, indent=2)
+        return self._vscode_config[1]
+
+# Smallest batch worth starting a process pool for
+_PARALLEL_MIN_FILES = 32
+
+def _validate_file(enforcer: FirstAttemptCorrectEnforcerExtended, file_path: Path) -> Dict[str, Any]:
+    """Live-validate one file; an unreadable file becomes a failed result, not an exception."""
+    try:
+        content = file_path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        return {
+            'yaml_valid': False,
+            'schema_valid': False,
+            'id_conflicts': [],
+            'suggested_refs': [],
+            'autocomplete': {},
+            'issues': [f"Read error: {e}"]
+        }
+    return enforcer.validate_content_live(content, file_path=file_path)
+
+def validate_files(enforcer: FirstAttemptCorrectEnforcerExtended, repo_root: Path,
+                   paths: List[Path]) -> Iterator[Dict[str, Any]]:
+    """Live-validate files, yielding results in order as they become available.
+
+    Large batches use a process pool.
+    """
+    done = 0
+    if len(paths) >= _PARALLEL_MIN_FILES:
+        executor = None
+        try:
+            executor = ProcessPoolExecutor(initializer=_init_worker, initargs=(str(repo_root),))
+            # map() submits every chunk up front, so worker start-up failures surface here
+            pool_results = executor.map(_run_worker, paths, chunksize=16)
+        except OSError as e:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            print(f"⚠️  Parallel validation unavailable ({e}), validating inline", file=sys.stderr)
+        else:
+            # File errors are reported per file by _validate_file, so only pool failures are caught
+            with executor:
+                try:
+                    for results in pool_results:
+                        yield results
+                        done += 1
+                    return
+                except (BrokenProcessPool, pickle.PicklingError) as e:
+                    # e.g. module loaded under a name worker processes cannot import
+                    print(f"⚠️  Parallel validation unavailable ({e}), validating inline", file=sys.stderr)
+    # Continue after the results already yielded, so none is reported twice
+    for file_path in paths[done:]:
+        yield _validate_file(enforcer, file_path)
+
+# Process pool workers: one enforcer per worker, created by the initializer
+_worker_enforcer = None
+
+def _init_worker(repo_root: str):
+    global _worker_enforcer
+    _worker_enforcer = FirstAttemptCorrectEnforcerExtended(Path(repo_root))
+
+def _run_worker(file_path: Path) -> Dict[str, Any]:
+    return _validate_file(_worker_enforcer, file_path)
 
 def main(argv: List[str]) -> int:
     """Main entry point for real-time validation."""
@@ -385,8 +671,7 @@ def main(argv: List[str]) -> int:
                 print(f"❌ File not found: {file_path}")
                 return 1
             
-            content = file_path.read_text(encoding='utf-8')
-            results = enforcer.validate_content_live(content, file_path=file_path)
+            results = _validate_file(enforcer, file_path)
             
             print(f"📊 LIVE VALIDATION RESULTS: {file_path.name}")
             print(f"   YAML Valid: {'✅' if results['yaml_valid'] else '❌'}")
@@ -404,6 +689,16 @@ def main(argv: List[str]) -> int:
                 for ref in results['suggested_refs'][:3]:  # Top 3
                     print(f"   - {ref['title']} (confidence: {ref['confidence']:.2f})")
                     
+        elif command == 'validate-all':
+            if len(argv) < 3:
+                print("Usage: python Scripts/realtime-validator.py validate-all '<glob>'")
+                return 1
+            
+            # One enforcer per process for all files; one JSON result per line, streamed as it is ready
+            paths = sorted(path for path in map(Path, glob.glob(argv[2], recursive=True)) if path.is_file())
+            for file_path, results in zip(paths, validate_files(enforcer, repo_root, paths)):
+                print(json.dumps({'file': str(file_path), **results}, ensure_ascii=False), flush=True)
+                    
         elif command == 'vscode':
             # Generate VS Code configuration
             config = enforcer.create_vscode_integration()
@@ -418,9 +713,10 @@ def main(argv: List[str]) -> int:
     else:
         print("Real-time Validation System")
         print("Commands:")
-        print("  monitor           - Start real-time file monitoring")
-        print("  validate <file>   - Validate specific file")
-        print("  vscode            - Generate VS Code integration")
+        print("  monitor             - Start real-time file monitoring")
+        print("  validate <file>     - Validate specific file")
+        print("  validate-all <glob> - Validate matching files (JSON lines)")
+        print("  vscode              - Generate VS Code integration")
     
     return 0
 
@@ -16,14 +16,113 @@ Usage:
 import os
 import re
 import json
+import time
 import yaml
+import pickle
+import shutil
+import hashlib
+import tempfile
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
-@dataclass
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+
+try:
+    import orjson  # optional, speeds up reading and writing the registry
+except ImportError:
+    orjson = None
+
+# Directories never descended into while scanning for requirement IDs
+_PRUNE_DIRS = frozenset({
+    '.git', '.hg', '.svn',
+    'node_modules', '.venv', 'venv', '__pycache__',
+    'build', 'dist', 'out', 'target',
+})
+
+# Functional and non-functional requirement IDs in one pattern
+_REQ_ID_RE = re.compile(r'REQ-(F|NF)-(\d+)')
+_REQ_ID_FORMAT_RE = re.compile(r'REQ-(F|NF)-\d{3}')
+_FRONT_MATTER_END_RE = re.compile(r'\n---\s*\n')
+
+# Front matter fields every specification must define
+_REQUIRED_FIELDS = ('specType', 'standard', 'requirements')
+
+# Per-file scan results kept in .git/spec-cache, so unchanged files are not re-read.
+# Files modified this recently are not cached: a later edit could keep the same mtime.
+_SCAN_CACHE_NAME = 'requirement-id-scan.json'
+_SCAN_CACHE_RACY_NS = 2_000_000_000
+
+# Scanning is spread over worker processes from this many files; per-file work
+# is a single regex pass, so the pool only pays off on large trees
+_PARALLEL_MIN_FILES = 2000
+
+
+def _iter_md_files(root: Path):
+    """Yield DirEntry objects of markdown files under root in the same order as rglob('*.md').
+
+    Any entry whose name contains '.git' is skipped as well, which keeps the
+    example IDs in .github/ prompts and instructions out of the registry.
+    """
+    stack = [str(root)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if '.git' in name:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in _PRUNE_DIRS:
+                                subdirs.append(entry.path)
+                        elif name.endswith('.md') and entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        # Reversed so subdirectories are visited depth-first in scandir order
+        stack.extend(reversed(subdirs))
+
+def _scan_file(md_path: str) -> List[Tuple[str, int, int, str]]:
+    """(type, number, line number, stripped line) for each requirement ID in a file"""
+    try:
+        with open(md_path, 'rb') as f:
+            data = f.read()
+        # Files without any requirement ID need neither decoding nor a line scan
+        if b'REQ-' not in data:
+            return []
+        content = data.decode('utf-8')
+    except (UnicodeDecodeError, PermissionError):
+        return []
+    if '\r' in content:  # same newline handling as text mode
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+    # Line numbers and text are only worked out for lines holding an ID
+    hits = []
+    line_num, line_start = 1, 0
+    for match in _REQ_ID_RE.finditer(content):
+        start = match.start()
+        newlines = content.count('\n', line_start, start)
+        if newlines:
+            line_num += newlines
+            line_start = content.rfind('\n', line_start, start) + 1
+        line_end = content.find('\n', start)
+        line = content[line_start:line_end if line_end != -1 else len(content)]
+        kind, digits = match.groups()
+        hits.append((kind, int(digits), line_num, line.strip()))
+    return hits
+
+@dataclass(slots=True)
 class RequirementID:
     """Represents a requirement ID with metadata"""
     id: str
@@ -34,7 +133,7 @@ class RequirementID:
     standard: Optional[str] = None
     description: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class IDRegistry:
     """Registry tracking all requirement IDs"""
     functional_ids: Dict[int, RequirementID]
@@ -47,24 +146,29 @@ class IDRegistry:
 class RequirementIDManager:
     """Main class for managing requirement IDs across all specifications"""
     
-    def __init__(self, repo_root: str):
+    def __init__(self, repo_root: str, compact: bool = False):
         self.repo_root = Path(repo_root)
+        self.compact = compact  # write the registry without indentation
         self.registry_file = self.repo_root / "Scripts" / "requirement-id-registry.json"
+        # One clock reading per command run, shared by every timestamp it writes
+        self._now = datetime.now()
+        self._today = self._now.strftime('%Y-%m-%d')
         self.registry: IDRegistry = self._load_or_create_registry()
+        self._dirty = False
         
     def _load_or_create_registry(self) -> IDRegistry:
         """Load existing registry or create new one"""
         if self.registry_file.exists():
-            with open(self.registry_file, 'r') as f:
-                data = json.load(f)
-                return IDRegistry(
-                    functional_ids={int(k): RequirementID(**v) for k, v in data['functional_ids'].items()},
-                    non_functional_ids={int(k): RequirementID(**v) for k, v in data['non_functional_ids'].items()},
-                    next_functional=data['next_functional'],
-                    next_non_functional=data['next_non_functional'],
-                    last_updated=data['last_updated'],
-                    conflicts=data['conflicts']
-                )
+            raw = self.registry_file.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            return IDRegistry(
+                functional_ids={int(k): RequirementID(**v) for k, v in data['functional_ids'].items()},
+                non_functional_ids={int(k): RequirementID(**v) for k, v in data['non_functional_ids'].items()},
+                next_functional=data['next_functional'],
+                next_non_functional=data['next_non_functional'],
+                last_updated=data['last_updated'],
+                conflicts=data['conflicts']
+            )
         else:
             return IDRegistry(
                 functional_ids={},
@@ -72,27 +176,133 @@ class RequirementIDManager:
                 next_functional=1,
                 next_non_functional=1,
                 conflicts=[],
-                last_updated=datetime.now().isoformat()
+                last_updated=self._now.isoformat()
             )
     
     def save_registry(self):
-        """Save registry to file"""
-        self.registry.last_updated = datetime.now().isoformat()
+        """Save registry to file (temp file + rename, so it is never left half-written)"""
+        self.registry.last_updated = self._now.isoformat()
         
-        # Convert to serializable format
+        # Convert to serializable format (RequirementID dataclasses are encoded as objects)
         data = {
-            'functional_ids': {str(k): asdict(v) for k, v in self.registry.functional_ids.items()},
-            'non_functional_ids': {str(k): asdict(v) for k, v in self.registry.non_functional_ids.items()},
+            'functional_ids': {str(k): v for k, v in self.registry.functional_ids.items()},
+            'non_functional_ids': {str(k): v for k, v in self.registry.non_functional_ids.items()},
             'next_functional': self.registry.next_functional,
             'next_non_functional': self.registry.next_non_functional,
             'last_updated': self.registry.last_updated,
             'conflicts': self.registry.conflicts
         }
         
+        if orjson is not None:
+            payload = orjson.dumps(data, option=0 if self.compact else orjson.OPT_INDENT_2)
+        elif self.compact:
+            payload = json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=asdict).encode('utf-8')
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False, default=asdict).encode('utf-8')
+        
         os.makedirs(self.registry_file.parent, exist_ok=True)
-        with open(self.registry_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Uniquely named temp file + rename so concurrent runs never share a temp file and an
+        # interrupted save never leaves a truncated registry; existing permission bits are kept
+        tmp_file = tempfile.NamedTemporaryFile('wb', dir=self.registry_file.parent,
+                                               prefix=f'.{self.registry_file.name}.', suffix='.tmp', delete=False)
+        try:
+            with tmp_file:
+                tmp_file.write(payload)
+            if self.registry_file.exists():
+                shutil.copymode(self.registry_file, tmp_file.name)
+            os.replace(tmp_file.name, self.registry_file)
+        except BaseException:
+            os.unlink(tmp_file.name)
+            raise
+        self._dirty = False
+
+    def flush(self):
+        """Save the registry if IDs were reserved since it was last written"""
+        if self._dirty:
+            self.save_registry()
     
+    def _scan_files(self, md_paths: List[str]) -> List[List[Tuple[str, int, int, str]]]:
+        """Requirement ID hits per file, spread over worker processes for large trees"""
+        if len(md_paths) >= _PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor() as executor:
+                    return list(executor.map(_scan_file, md_paths, chunksize=64))
+            except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+                # e.g. module loaded under a name worker processes cannot import
+                print(f"⚠️  Parallel scan unavailable ({e}), scanning inline")
+        return [_scan_file(md_path) for md_path in md_paths]
+
+    def _scan_cache_file(self) -> Optional[Path]:
+        """Scan cache location, or None when repo_root is not a git checkout"""
+        git_dir = self.repo_root / '.git'
+        return git_dir / 'spec-cache' / _SCAN_CACHE_NAME if git_dir.is_dir() else None
+
+    def _load_scan_cache(self, fingerprint: str) -> dict:
+        """Load path -> [[mtime_ns, size], hits] entries written by this version of the scanner"""
+        cache_file = self._scan_cache_file()
+        if cache_file is None:
+            return {}
+        try:
+            data = json.loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('fingerprint') != fingerprint:
+            return {}
+        return data.get('entries', {})
+
+    def _save_scan_cache(self, fingerprint: str, entries: dict) -> None:
+        """Atomically write the scan cache; caching failures are ignored"""
+        cache_file = self._scan_cache_file()
+        if cache_file is None:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Uniquely named temp file so concurrent scans never write into each other's copy
+            tmp_file = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_file.parent,
+                                                   prefix=f'.{cache_file.name}.', suffix='.tmp', delete=False)
+            try:
+                with tmp_file:
+                    tmp_file.write(json.dumps({'fingerprint': fingerprint, 'entries': entries}))
+                os.replace(tmp_file.name, cache_file)
+            except BaseException:
+                os.unlink(tmp_file.name)
+                raise
+        except OSError:
+            pass
+
+    def _scan_hits(self, md_entries: List[os.DirEntry]) -> List[List[Tuple[str, int, int, str]]]:
+        """Requirement ID hits per file, reusing cached hits for files unchanged since the last scan"""
+        # The scanner's own source: changing how IDs are found invalidates the cache
+        fingerprint = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+        cached_entries = self._load_scan_cache(fingerprint)
+        scan_start = time.time_ns()
+
+        results: List[Optional[list]] = [None] * len(md_entries)
+        new_entries = {}
+        stale = []
+        for i, entry in enumerate(md_entries):
+            try:
+                st = entry.stat()
+                stamp = [st.st_mtime_ns, st.st_size]
+            except OSError:
+                stamp = None
+            cached = cached_entries.get(entry.path)
+            if stamp is not None and cached is not None and cached[0] == stamp:
+                results[i] = cached[1]
+                new_entries[entry.path] = cached
+            else:
+                stale.append((i, stamp))
+
+        fresh = self._scan_files([md_entries[i].path for i, _ in stale])
+        for (i, stamp), hits in zip(stale, fresh):
+            results[i] = hits
+            if stamp is not None and stamp[0] < scan_start - _SCAN_CACHE_RACY_NS:
+                new_entries[md_entries[i].path] = [stamp, hits]
+
+        # Only files seen in this scan are kept, so deleted files drop out
+        self._save_scan_cache(fingerprint, new_entries)
+        return results
+
     def scan_existing_ids(self) -> Tuple[int, int]:
         """Scan all markdown files for existing requirement IDs"""
         print("Scanning existing requirement IDs...")
@@ -102,73 +312,37 @@ class RequirementIDManager:
         self.registry.non_functional_ids = {}
         self.registry.conflicts = []
         
-        # Patterns to match requirement IDs
-        f_pattern = re.compile(r'REQ-F-(\d+)')
-        nf_pattern = re.compile(r'REQ-NF-(\d+)')
-        
+        # Highest number seen per type, kept while scanning
+        highest = {'F': 0, 'NF': 0}
+
         # Scan all markdown files
-        for md_file in self.repo_root.rglob('*.md'):
-            if '.git' in str(md_file):
-                continue
-                
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    
-                for line_num, line in enumerate(lines, 1):
-                    # Find functional requirements
-                    for match in f_pattern.finditer(line):
-                        num = int(match.group(1))
-                        req_id = RequirementID(
-                            id=f"REQ-F-{num:03d}",
-                            type='F',
-                            number=num,
-                            file_path=str(md_file.relative_to(self.repo_root)),
-                            line_number=line_num,
-                            description=line.strip()
-                        )
-                        
-                        if num in self.registry.functional_ids:
-                            self.registry.conflicts.append(
-                                f"Duplicate REQ-F-{num:03d} in {req_id.file_path}:{line_num} and "
-                                f"{self.registry.functional_ids[num].file_path}:{self.registry.functional_ids[num].line_number}"
-                            )
-                        else:
-                            self.registry.functional_ids[num] = req_id
-                    
-                    # Find non-functional requirements  
-                    for match in nf_pattern.finditer(line):
-                        num = int(match.group(1))
-                        req_id = RequirementID(
-                            id=f"REQ-NF-{num:03d}",
-                            type='NF',
-                            number=num,
-                            file_path=str(md_file.relative_to(self.repo_root)),
-                            line_number=line_num,
-                            description=line.strip()
-                        )
-                        
-                        if num in self.registry.non_functional_ids:
-                            self.registry.conflicts.append(
-                                f"Duplicate REQ-NF-{num:03d} in {req_id.file_path}:{line_num} and "
-                                f"{self.registry.non_functional_ids[num].file_path}:{self.registry.non_functional_ids[num].line_number}"
-                            )
-                        else:
-                            self.registry.non_functional_ids[num] = req_id
-                            
-            except (UnicodeDecodeError, PermissionError):
+        md_entries = list(_iter_md_files(self.repo_root))
+        for entry, hits in zip(md_entries, self._scan_hits(md_entries)):
+            if not hits:
                 continue
+            file_path = str(Path(entry.path).relative_to(self.repo_root))
+            for kind, num, line_num, description in hits:
+                ids = self.registry.functional_ids if kind == 'F' else self.registry.non_functional_ids
+                if num in ids:
+                    self.registry.conflicts.append(
+                        f"Duplicate REQ-{kind}-{num:03d} in {file_path}:{line_num} and "
+                        f"{ids[num].file_path}:{ids[num].line_number}"
+                    )
+                else:
+                    ids[num] = RequirementID(
+                        id=f"REQ-{kind}-{num:03d}",
+                        type=kind,
+                        number=num,
+                        file_path=file_path,
+                        line_number=line_num,
+                        description=description
+                    )
+                    if num > highest[kind]:
+                        highest[kind] = num
         
         # Calculate next available IDs
-        if self.registry.functional_ids:
-            self.registry.next_functional = max(self.registry.functional_ids.keys()) + 1
-        else:
-            self.registry.next_functional = 1
-            
-        if self.registry.non_functional_ids:
-            self.registry.next_non_functional = max(self.registry.non_functional_ids.keys()) + 1
-        else:
-            self.registry.next_non_functional = 1
+        self.registry.next_functional = highest['F'] + 1
+        self.registry.next_non_functional = highest['NF'] + 1
         
         self.save_registry()
         
@@ -185,7 +359,19 @@ class RequirementIDManager:
         return len(self.registry.functional_ids), len(self.registry.non_functional_ids)
     
     def get_next_functional_ids(self, count: int) -> List[str]:
-        """Get next available functional requirement IDs"""
+        """Get next available functional requirement IDs (reserved in the saved registry)"""
+        ids = self._reserve_functional_ids(count)
+        self.flush()
+        return ids
+    
+    def get_next_non_functional_ids(self, count: int) -> List[str]:
+        """Get next available non-functional requirement IDs (reserved in the saved registry)"""
+        ids = self._reserve_non_functional_ids(count)
+        self.flush()
+        return ids
+    
+    def _reserve_functional_ids(self, count: int) -> List[str]:
+        """Reserve the next functional IDs in memory; flush() persists them"""
         ids = []
         start = self.registry.next_functional
         
@@ -195,12 +381,12 @@ class RequirementIDManager:
             
         # Reserve these IDs
         self.registry.next_functional = start + count
-        self.save_registry()
+        self._dirty = True
         
         return ids
     
-    def get_next_non_functional_ids(self, count: int) -> List[str]:
-        """Get next available non-functional requirement IDs"""
+    def _reserve_non_functional_ids(self, count: int) -> List[str]:
+        """Reserve the next non-functional IDs in memory; flush() persists them"""
         ids = []
         start = self.registry.next_non_functional
         
@@ -210,10 +396,21 @@ class RequirementIDManager:
             
         # Reserve these IDs
         self.registry.next_non_functional = start + count
-        self.save_registry()
+        self._dirty = True
         
         return ids
     
+    def _parse_front_matter(self, content: str) -> Optional[Tuple[object, str]]:
+        """Parse the front matter of spec content starting with '---'.
+
+        Returns (front matter, content after the closing ---), or None when the
+        block is not closed.
+        """
+        end_match = _FRONT_MATTER_END_RE.search(content)
+        if not end_match:
+            return None
+        return yaml.load(content[3:end_match.start()], Loader=SafeLoader), content[end_match.end():]
+
     def validate_yaml_front_matter(self, file_path: str) -> List[str]:
         """Validate YAML front matter in a specification file"""
         errors = []
@@ -227,31 +424,25 @@ class RequirementIDManager:
                 errors.append("Missing YAML front matter")
                 return errors
             
-            # Find end of front matter
-            end_match = re.search(r'\n---\s*\n', content)
-            if not end_match:
-                errors.append("Malformed YAML front matter (missing closing ---)")
-                return errors
-            
-            yaml_content = content[3:end_match.start()]
-            
             try:
-                yaml_data = yaml.safe_load(yaml_content)
+                parsed = self._parse_front_matter(content)
             except yaml.YAMLError as e:
                 errors.append(f"Invalid YAML syntax: {e}")
                 return errors
+            if parsed is None:
+                errors.append("Malformed YAML front matter (missing closing ---)")
+                return errors
+            yaml_data = parsed[0]
             
             # Validate required fields
-            required_fields = ['specType', 'standard', 'requirements']
-            for field in required_fields:
-                if field not in yaml_data:
-                    errors.append(f"Missing required field: {field}")
+            errors.extend(f"Missing required field: {field}"
+                          for field in _REQUIRED_FIELDS if field not in yaml_data)
             
             # Validate requirement ID format
             if 'requirements' in yaml_data:
-                for req_id in yaml_data['requirements']:
-                    if not re.match(r'REQ-(F|NF)-\d{3}', req_id):
-                        errors.append(f"Invalid requirement ID format: {req_id}")
+                is_valid_id = _REQ_ID_FORMAT_RE.match
+                errors.extend(f"Invalid requirement ID format: {req_id}"
+                              for req_id in yaml_data['requirements'] if not is_valid_id(req_id))
             
         except Exception as e:
             errors.append(f"Error reading file: {e}")
@@ -262,9 +453,10 @@ class RequirementIDManager:
         """Auto-assign requirement IDs to a specification file"""
         print(f"Auto-assigning IDs to {spec_file}...")
         
-        # Get required IDs
-        f_ids = self.get_next_functional_ids(functional_count) if functional_count > 0 else []
-        nf_ids = self.get_next_non_functional_ids(non_functional_count) if non_functional_count > 0 else []
+        # Get required IDs, saving the registry once for both kinds
+        f_ids = self._reserve_functional_ids(functional_count) if functional_count > 0 else []
+        nf_ids = self._reserve_non_functional_ids(non_functional_count) if non_functional_count > 0 else []
+        self.flush()
         
         # Read current file
         with open(spec_file, 'r', encoding='utf-8') as f:
@@ -272,25 +464,26 @@ class RequirementIDManager:
         
         # Extract and update YAML front matter
         if content.startswith('---'):
-            end_match = re.search(r'\n---\s*\n', content)
-            if end_match:
-                yaml_content = content[3:end_match.start()]
-                rest_content = content[end_match.end():]
+            try:
+                parsed = self._parse_front_matter(content)
+            except yaml.YAMLError as e:
+                print(f"❌ Error updating YAML: {e}")
+                return
+            if parsed is not None:
+                yaml_data, rest_content = parsed
                 
                 try:
-                    yaml_data = yaml.safe_load(yaml_content)
-                    
                     # Update requirements list
                     all_req_ids = f_ids + nf_ids
                     yaml_data['requirements'] = all_req_ids
                     
                     # Update other metadata
                     yaml_data['version'] = yaml_data.get('version', '1.0.0')
-                    yaml_data['date'] = datetime.now().strftime('%Y-%m-%d')
+                    yaml_data['date'] = self._today
                     yaml_data['status'] = yaml_data.get('status', 'draft')
                     
                     # Write back
-                    new_yaml = yaml.dump(yaml_data, default_flow_style=False, sort_keys=False)
+                    new_yaml = yaml.dump(yaml_data, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
                     new_content = f"---\n{new_yaml}---\n{rest_content}"
                     
                     with open(spec_file, 'w', encoding='utf-8') as f:
@@ -318,10 +511,11 @@ def main():
     parser.add_argument('--f-count', type=int, default=50, help='Number of functional requirements to assign')
     parser.add_argument('--nf-count', type=int, default=0, help='Number of non-functional requirements to assign')
     parser.add_argument('--repo-root', default='.', help='Repository root directory')
+    parser.add_argument('--compact', action='store_true', help='Write the registry as compact JSON (faster for large registries)')
     
     args = parser.parse_args()
     
-    manager = RequirementIDManager(args.repo_root)
+    manager = RequirementIDManager(args.repo_root, compact=args.compact)
     
     if args.scan:
         manager.scan_existing_ids()
@@ -5,19 +5,33 @@ Simple Bulk Fix Script - Proof of Concept
 Demonstrates the ID field setting and schema-based fixing.
 """
 
+import copy
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 import yaml
 import re
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+
+_ADR_RE = re.compile(r'ADR-(\d{3})')
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+$')
+_MAJOR_MINOR_RE = re.compile(r'^\d+\.\d+$')
+_REQ_ID_RE = re.compile(r'^REQ-(F|NF)-\d{3,4}$')
+
 def extract_id_from_filename(file_path: Path) -> str:
     """Extract correct ID from filename."""
     filename = file_path.name
     
     # ADR pattern: ADR-003 from ADR-003-ieee-1588.md
     if 'ADR-' in filename.upper():
-        match = re.search(r'ADR-(\d{3})', filename.upper())
+        match = _ADR_RE.search(filename.upper())
         if match:
             return f"ADR-{match.group(1)}"
     
@@ -45,10 +59,10 @@ def fix_single_file(file_path: Path) -> bool:
         
         # Extract current YAML front matter
         if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                current_yaml = yaml.safe_load(parts[1])
-                body_content = parts[2]
+            end = content.find('---', 3)
+            if end != -1:
+                current_yaml = yaml.load(content[3:end], Loader=SafeLoader)
+                body_content = content[end + 3:]
             else:
                 print(f"   ❌ Invalid YAML format")
                 return False
@@ -63,6 +77,7 @@ def fix_single_file(file_path: Path) -> bool:
         # Fix common issues
         if current_yaml is None:
             current_yaml = {}
+        original_yaml = copy.deepcopy(current_yaml)
         
         # Add/fix required fields
         current_yaml['id'] = correct_id
@@ -83,10 +98,10 @@ def fix_single_file(file_path: Path) -> bool:
         # Fix version format to semver
         if 'version' in current_yaml:
             version = str(current_yaml['version'])
-            if not re.match(r'^\d+\.\d+\.\d+$', version):
+            if not _SEMVER_RE.match(version):
                 if version in ['1.0', '2.0']:
                     current_yaml['version'] = f"{version}.0"
-                elif re.match(r'^\d+\.\d+$', version):
+                elif _MAJOR_MINOR_RE.match(version):
                     current_yaml['version'] = f"{version}.0"
                 else:
                     current_yaml['version'] = '1.0.0'
@@ -109,7 +124,7 @@ def fix_single_file(file_path: Path) -> bool:
                                 fixed_reqs.append('REQ-NF-001')  # Example mapping
                             else:
                                 fixed_reqs.append('REQ-F-001')   # Example mapping
-                        elif not re.match(r'^REQ-(F|NF)-\d{3,4}$', req_str):
+                        elif not _REQ_ID_RE.match(req_str):
                             # Invalid format, replace with valid example
                             fixed_reqs.append('REQ-F-001')
                         else:
@@ -122,11 +137,27 @@ def fix_single_file(file_path: Path) -> bool:
         elif current_yaml.get('specType') == 'requirements' and 'traceability' not in current_yaml:
             current_yaml['traceability'] = {'stakeholderRequirements': ['StR-001']}
         
+        # Nothing to fix: leave the file (and its mtime) alone
+        if current_yaml == original_yaml:
+            print(f"   ✅ Already correct with id: {correct_id}")
+            return True
+        
         # Write fixed content
-        new_yaml_str = yaml.dump(current_yaml, default_flow_style=False, sort_keys=False)
+        new_yaml_str = yaml.dump(current_yaml, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
         fixed_content = f"---\n{new_yaml_str}---{body_content}"
         
-        file_path.write_text(fixed_content, encoding='utf-8')
+        # Uniquely named temp file + rename so an interrupted run never leaves a truncated spec;
+        # the original permission bits are carried over before the swap
+        tmp_file = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=file_path.parent,
+                                               prefix=f'.{file_path.name}.', suffix='.tmp', delete=False)
+        try:
+            with tmp_file:
+                tmp_file.write(fixed_content)
+            shutil.copymode(file_path, tmp_file.name)
+            os.replace(tmp_file.name, file_path)
+        except BaseException:
+            os.unlink(tmp_file.name)
+            raise
         print(f"   ✅ Fixed with id: {correct_id}")
         return True
         
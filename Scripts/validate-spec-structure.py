@@ -18,6 +18,10 @@ try:
 except ImportError:
     print("Missing dependency pyyaml. Install with: pip install pyyaml jsonschema", file=sys.stderr)
     sys.exit(2)
+try:
+    from yaml import CSafeLoader as SafeLoader  # type: ignore
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore
 try:
     import jsonschema  # type: ignore
 except ImportError:
@@ -48,7 +52,7 @@ def extract_front_matter(text: str) -> t.Optional[str]:
 
 def parse_yaml_block(block: str) -> t.Optional[dict]:
     try:
-        return yaml.safe_load(block) or {}
+        return yaml.load(block, Loader=SafeLoader) or {}
     except Exception as e:
         return None
 
@@ -73,10 +77,12 @@ def is_guidance(path: pathlib.Path, meta: dict | None) -> bool:
     return any(h in lower for h in GUIDANCE_HINTS)
 
 
-def validate_spec(path: pathlib.Path) -> tuple[list[ValidationIssue], list[str]]:
+def validate_spec(path: pathlib.Path, text: str | None = None) -> tuple[list[ValidationIssue], list[str]]:
+    """Validate one spec file; ``text`` overrides the on-disk content (e.g. a staged blob)."""
     issues: list[ValidationIssue] = []
     warnings: list[str] = []
-    text = path.read_text(encoding='utf-8', errors='ignore')
+    if text is None:
+        text = path.read_text(encoding='utf-8', errors='ignore')
     fm_raw = extract_front_matter(text)
     if not fm_raw:
         # Guidance files without front matter -> warning, not error
@@ -162,6 +168,11 @@ def validate_spec(path: pathlib.Path) -> tuple[list[ValidationIssue], list[str]]
     return issues, warnings
 
 
+def validate_spec_bytes(path: pathlib.Path, data: bytes) -> tuple[list[ValidationIssue], list[str]]:
+    """Validate spec content supplied as raw bytes (e.g. a staged git blob)."""
+    return validate_spec(path, data.decode('utf-8', errors='ignore'))
+
+
 def discover_targets(explicit: list[str]) -> list[pathlib.Path]:
     if explicit:
         return [pathlib.Path(p).resolve() for p in explicit]
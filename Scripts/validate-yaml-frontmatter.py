@@ -21,6 +21,11 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 class YAMLFrontMatterValidator:
     """Validates and fixes YAML front matter in specification files"""
     
@@ -77,7 +82,7 @@ class YAMLFrontMatterValidator:
             
             # Parse YAML
             try:
-                yaml_data = yaml.safe_load(yaml_content)
+                yaml_data = yaml.load(yaml_content, Loader=SafeLoader)
                 if yaml_data is None:
                     yaml_data = {}
             except yaml.YAMLError as e:
@@ -193,7 +198,7 @@ class YAMLFrontMatterValidator:
             
             # Parse and fix YAML
             try:
-                yaml_data = yaml.safe_load(yaml_content) or {}
+                yaml_data = yaml.load(yaml_content, Loader=SafeLoader) or {}
             except yaml.YAMLError:
                 print(f"❌ {file_path}: Cannot parse YAML")
                 return False